@@ -14,9 +14,13 @@ CREATE TABLE IF NOT EXISTS issues (
   taxonomy_json   TEXT,
   frequency       INTEGER,
   metadata_json   TEXT,
-  updated_at      TEXT
+  updated_at      TEXT,
+  metadata_type   TEXT GENERATED ALWAYS AS (json_extract(metadata_json, '$.type')) VIRTUAL
 );
 
+-- Covers the severity/type breakdown in render_memory_bank without decoding JSON per row.
+CREATE INDEX IF NOT EXISTS idx_issues_severity_type ON issues(severity, metadata_type);
+
 CREATE TABLE IF NOT EXISTS signals (
   issue_id  TEXT NOT NULL,
   kind      TEXT,
@@ -3,11 +3,33 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import operator
 import os
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+Rule = Tuple[str, Callable[[Any, Any], bool], float, str, str]
+
+# (metric, comparison, threshold key, message, severity); for a metric with
+# several tiers the first matching rule wins, so order strictest first.
+_RULE_SPECS = (
+    ("collection_success_rate", operator.lt, "collection_success_rate",
+     "Collection success rate below threshold", "ERROR"),
+    ("index_build_time_seconds", operator.gt, "index_build_time_seconds",
+     "Index build time exceeds threshold", "WARN"),
+    ("disk_usage", operator.gt, "disk_usage_critical",
+     "Disk usage above critical threshold", "CRITICAL"),
+    ("disk_usage", operator.gt, "disk_usage_warn",
+     "Disk usage above warning threshold", "WARN"),
+    ("memory_usage_mb", operator.gt, "memory_usage_mb",
+     "Memory usage above threshold", "WARN"),
+    ("api_rate_limited_ratio", operator.gt, "api_rate_limited_ratio",
+     "API rate-limited requests ratio too high", "WARN"),
+)
 
 
 @dataclass
@@ -29,76 +51,41 @@ class AlertManager:
         output_path: Optional[Path] = None,
     ) -> None:
         if thresholds is None:
-            thresholds = load_thresholds(parse_args([]))
+            thresholds = load_thresholds(argparse.Namespace())
+        else:
+            # Keys missing from a partial mapping come from the config file.
+            thresholds = {**_default_thresholds(), **thresholds}
         self.thresholds = thresholds
         self.output_path = output_path or Path("alerts") / "active_alerts.json"
 
+    @property
+    def thresholds(self) -> Mapping[str, float]:
+        """Read-only view of the active thresholds; assign to replace them."""
+        return self._thresholds
+
+    @thresholds.setter
+    def thresholds(self, thresholds: Mapping[str, float]) -> None:
+        self._thresholds = MappingProxyType(dict(thresholds))
+        # Rules whose threshold is unknown are skipped rather than failing.
+        self._rules: List[Rule] = [
+            (metric, op, thresholds[key], message, severity)
+            for metric, op, key, message, severity in _RULE_SPECS
+            if key in thresholds
+        ]
+
     def evaluate(self, metrics: Dict[str, Any]) -> List[Alert]:
         """Return alerts for metrics breaching thresholds."""
-        t = self.thresholds
         alerts: List[Alert] = []
-
-        rate = metrics.get("collection_success_rate")
-        if rate is not None and rate < t["collection_success_rate"]:
-            alerts.append(
-                Alert(
-                    "collection_success_rate",
-                    "Collection success rate below threshold",
-                    "ERROR",
-                )
-            )
-
-        build_time = metrics.get("index_build_time_seconds")
-        if build_time is not None and build_time > t["index_build_time_seconds"]:
-            alerts.append(
-                Alert(
-                    "index_build_time_seconds",
-                    "Index build time exceeds threshold",
-                    "WARN",
-                )
-            )
-
-        disk_usage = metrics.get("disk_usage")
-        if disk_usage is not None:
-            if disk_usage > t["disk_usage_critical"]:
-                alerts.append(
-                    Alert(
-                        "disk_usage",
-                        "Disk usage above critical threshold",
-                        "CRITICAL",
-                    )
-                )
-            elif disk_usage > t["disk_usage_warn"]:
-                alerts.append(
-                    Alert(
-                        "disk_usage",
-                        "Disk usage above warning threshold",
-                        "WARN",
-                    )
-                )
-
-        mem = metrics.get("memory_usage_mb")
-        if mem is not None and mem > t["memory_usage_mb"]:
-            alerts.append(
-                Alert(
-                    "memory_usage_mb",
-                    "Memory usage above threshold",
-                    "WARN",
-                )
-            )
-
-        rate_limited = metrics.get("api_rate_limited_ratio")
-        if rate_limited is not None and rate_limited > t["api_rate_limited_ratio"]:
-            alerts.append(
-                Alert(
-                    "api_rate_limited_ratio",
-                    "API rate-limited requests ratio too high",
-                    "WARN",
-                )
-            )
-
-        fts5_ok = metrics.get("fts5_integrity_ok", True)
-        if not fts5_ok:
+        matched = None
+        for key, op, threshold, message, severity in self._rules:
+            if key == matched:
+                continue
+            value = metrics.get(key)
+            if value is not None and op(value, threshold):
+                alerts.append(Alert(key, message, severity))
+                matched = key
+
+        if not metrics.get("fts5_integrity_ok", True):
             alerts.append(
                 Alert(
                     "fts5_integrity",
@@ -112,9 +99,15 @@ class AlertManager:
     def write_alerts(self, alerts: List[Alert]) -> None:
         """Write alerts to the configured output file."""
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
-        data = [asdict(a) for a in alerts]
-        with self.output_path.open("w", encoding="utf-8") as fh:
-            json.dump(data, fh, ensure_ascii=False, indent=2)
+        data = [
+            {"name": a.name, "message": a.message, "severity": a.severity}
+            for a in alerts
+        ]
+        # json.dumps runs the C encoder over the whole list and the result is
+        # written in one call; json.dump would stream many small fragments.
+        self.output_path.write_text(
+            json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
 
     def critical(self, message: str) -> None:
         """Write a single critical alert with the given message."""
@@ -129,13 +122,27 @@ class AlertManager:
         return alerts
 
 
+@functools.lru_cache(maxsize=8)
+def _read_config(config_path: Path, mtime_ns: int) -> Dict[str, float]:
+    """Parse the thresholds file; cached until its mtime changes."""
+    with config_path.open("r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _default_thresholds() -> Dict[str, float]:
+    """Return the configured thresholds, or an empty mapping if unreadable."""
+    try:
+        return load_thresholds(argparse.Namespace())
+    except (OSError, ValueError):
+        return {}
+
+
 def load_thresholds(
     args: argparse.Namespace,
     config_path: Path = Path(__file__).resolve().parent / "config" / "thresholds.json",
 ) -> Dict[str, float]:
     """Load thresholds with env and CLI overrides."""
-    with config_path.open("r", encoding="utf-8") as fh:
-        thresholds: Dict[str, float] = json.load(fh)
+    thresholds = dict(_read_config(config_path, config_path.stat().st_mtime_ns))
     for key, value in list(thresholds.items()):
         env_val = os.getenv(f"ALERT_{key.upper()}")
         if env_val is not None:
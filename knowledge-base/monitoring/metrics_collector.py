@@ -1,8 +1,13 @@
 import json
 import os
-from datetime import datetime, date, timezone
+import re
+import weakref
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Optional
+
+_PLAIN_FIELD = re.compile(r'[A-Za-z0-9_.:-]+\Z')
+_PLAIN_RECORD = '{"ts": "%s", "event_type": "%s", "status": "%s"}\n'
 
 
 class MetricsCollector:
@@ -12,9 +17,32 @@ class MetricsCollector:
         self.base_dir = Path(base_dir or Path('metrics') / 'daily')
         env_enabled = os.getenv('METRICS_ENABLED', 'true').lower() != 'false'
         self.enabled = env_enabled if enabled is None else enabled
+        self._day: Optional[str] = None
+        self._fh: Optional[BinaryIO] = None
+        self._finalizer: Optional[weakref.finalize] = None
+
+    def _handle_for(self, today: str) -> BinaryIO:
+        """Return the open JSONL handle for ``today``, rotating when the day changes."""
+        if today != self._day or self._fh is None:
+            self.close()
+            path = self.base_dir / f'{today}.json'
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Unbuffered O_APPEND: each record is one write() at the end of the
+            # file, so it reaches the OS immediately and lines from concurrent
+            # writers are never split.
+            self._fh = path.open('ab', buffering=0)
+            # Closes the handle at exit or when the collector is garbage
+            # collected, without keeping the collector alive.
+            self._finalizer = weakref.finalize(self, self._fh.close)
+            self._day = today
+        return self._fh
 
-    def _get_today(self) -> date:
-        return datetime.now(timezone.utc).date()
+    def close(self) -> None:
+        """Close the current day's file, if open."""
+        if self._fh is not None:
+            self._finalizer.detach()
+            self._fh.close()
+            self._fh = None
 
     @staticmethod
     def _validate(event_type: str, status: str) -> None:
@@ -41,21 +69,29 @@ class MetricsCollector:
 
         self._validate(event_type, status)
 
-        record = {
-            'ts': datetime.now(timezone.utc).isoformat(),
-            'event_type': event_type,
-            'status': status,
-        }
-        if duration_ms is not None:
-            record['duration_ms'] = duration_ms
-        if details is not None:
-            record['details'] = details
-        if cid is not None:
-            record['cid'] = cid
-
-        today = self._get_today().isoformat()
-        path = self.base_dir / f'{today}.json'
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open('a', encoding='utf-8') as fh:
-            json.dump(record, fh, ensure_ascii=False)
-            fh.write('\n')
+        now = datetime.now(timezone.utc)
+        fh = self._handle_for(now.date().isoformat())
+        if (
+            duration_ms is None
+            and details is None
+            and cid is None
+            and _PLAIN_FIELD.match(event_type)
+            and _PLAIN_FIELD.match(status)
+        ):
+            # Common case: no optional fields and nothing that needs escaping, so
+            # the line is formatted directly instead of going through json.dumps.
+            fh.write((_PLAIN_RECORD % (now.isoformat(), event_type, status)).encode('ascii'))
+        else:
+            record = {
+                'ts': now.isoformat(),
+                'event_type': event_type,
+                'status': status,
+            }
+            if duration_ms is not None:
+                record['duration_ms'] = duration_ms
+            if details is not None:
+                record['details'] = details
+            if cid is not None:
+                record['cid'] = cid
+
+            fh.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
@@ -12,16 +12,19 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
+import hashlib
 import logging
 import os
 import sqlite3
 import time
 import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
 
-from json_utils import load_json
+from json_utils import dumps, dumps_bytes, load_json, loads
 from memory_monitor import MemoryMonitor
 
 
@@ -32,6 +35,20 @@ STATE = ROOT / 'index_state.json'
 
 LOG_INTERVAL = 5000
 
+# Bulk-load settings: WAL with synchronous=NORMAL only syncs at checkpoints, and
+# a large page cache/mmap keeps the FTS working set out of repeated reads.
+BULK_PRAGMAS = """
+    PRAGMA foreign_keys=ON;
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-262144;
+    PRAGMA mmap_size=1073741824;
+    PRAGMA wal_autocheckpoint=10000;
+"""
+LOAD_WORKERS = 8
+PREFETCH_WINDOW = LOAD_WORKERS * 4
+
 
 def get_logger(correlation_id: str) -> logging.LoggerAdapter:
     """Return a structured logger with correlation ID."""
@@ -44,102 +61,148 @@ def get_logger(correlation_id: str) -> logging.LoggerAdapter:
     return logging.LoggerAdapter(base_logger, {'cid': correlation_id})
 
 
-def iter_issue_files() -> Iterable[Path]:
-    """Yield all JSON issue files lazily."""
+def _scan_dirs(path: str) -> List[os.DirEntry]:
+    with os.scandir(path) as it:
+        return [entry for entry in it if entry.is_dir()]
+
+
+def iter_issue_entries() -> Iterator[Tuple[str, os.DirEntry]]:
+    """Yield ``(state_key, entry)`` for every ``issues/<source>/<lang>/*.json`` file.
+
+    ``os.scandir`` is used instead of ``Path.glob`` so the directory entry can be
+    stat'ed directly and no ``Path`` is built for files that have not changed.
+    The key matches ``str(path.relative_to(ROOT))`` used by earlier state files.
+    """
+
+    issues_dir = ROOT / 'issues'
+    if not issues_dir.is_dir():
+        return
+    for source in _scan_dirs(str(issues_dir)):
+        for lang in _scan_dirs(source.path):
+            prefix = os.path.join('issues', source.name, lang.name)
+            with os.scandir(lang.path) as it:
+                for entry in it:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        yield os.path.join(prefix, entry.name), entry
+
+
+def iter_docs(pool: ThreadPoolExecutor, paths: List[Path]) -> Iterator[Dict[str, object]]:
+    """Yield decoded issue files in order, reading ahead on worker threads.
+
+    At most ``PREFETCH_WINDOW`` files are in flight so memory stays bounded while
+    the SQLite writer on the calling thread consumes documents.
+    """
 
-    return (ROOT / 'issues').glob('*/*/*.json')
+    pending: Deque[Future] = deque()
+    it = iter(paths)
+    for path in islice(it, PREFETCH_WINDOW):
+        pending.append(pool.submit(load_json, path))
+    while pending:
+        doc = pending.popleft().result()
+        for path in islice(it, 1):
+            pending.append(pool.submit(load_json, path))
+        yield doc
 
 
 def load_state() -> Dict[str, int]:
     if STATE.exists():
-        return json.loads(STATE.read_text(encoding='utf-8'))
+        return loads(STATE.read_bytes())
     return {}
 
 
 def save_state(state: Dict[str, int]) -> None:
-    STATE.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding='utf-8')
-
-
-def upsert_issue(cur: sqlite3.Cursor, doc: Dict[str, object]) -> None:
-    cur.execute(
-        """
-        INSERT INTO issues(
-            issue_id,source,source_rule_id,language,title,summary,fix_steps,
-            severity,confidence,taxonomy_json,frequency,metadata_json,updated_at
-        ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)
-        ON CONFLICT(issue_id) DO UPDATE SET
-            title=excluded.title,
-            summary=excluded.summary,
-            fix_steps=excluded.fix_steps,
-            severity=excluded.severity,
-            confidence=excluded.confidence,
-            frequency=excluded.frequency,
-            taxonomy_json=excluded.taxonomy_json,
-            metadata_json=excluded.metadata_json,
-            updated_at=excluded.updated_at
-        """,
-        (
-            doc['issue_id'],
-            doc['source'],
-            doc.get('source_rule_id'),
-            doc.get('language'),
-            doc['title'],
-            doc.get('summary'),
-            doc.get('fix_steps'),
-            doc.get('severity'),
-            doc.get('confidence'),
-            json.dumps(doc.get('taxonomy', {}), ensure_ascii=False),
-            doc.get('frequency'),
-            json.dumps(doc.get('metadata', {}), ensure_ascii=False),
-            doc.get('updated_at'),
-        ),
+    # Compact encoding: the state can hold one entry per issue file.
+    STATE.write_bytes(dumps_bytes(state))
+
+
+UPSERT_SQL = """
+    INSERT INTO issues(
+        issue_id,source,source_rule_id,language,title,summary,fix_steps,
+        severity,confidence,taxonomy_json,frequency,metadata_json,updated_at
+    ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)
+    ON CONFLICT(issue_id) DO UPDATE SET
+        title=excluded.title,
+        summary=excluded.summary,
+        fix_steps=excluded.fix_steps,
+        severity=excluded.severity,
+        confidence=excluded.confidence,
+        frequency=excluded.frequency,
+        taxonomy_json=excluded.taxonomy_json,
+        metadata_json=excluded.metadata_json,
+        updated_at=excluded.updated_at
+"""
+
+# ``fts_issues`` is contentless, so removing a row requires the exact values it
+# was indexed with. Both statements project the staged ids the same way.
+FTS_ROWS_SQL = """
+    SELECT {command}
+           i.rowid,
+           i.title,
+           COALESCE(i.summary,''),
+           COALESCE(i.fix_steps,''),
+           COALESCE(s.signals_concat,''),
+           COALESCE(i.language,'')
+    FROM issues i
+    LEFT JOIN (SELECT issue_id, TRIM(GROUP_CONCAT(value,' ')) AS signals_concat
+               FROM signals
+               WHERE issue_id IN (SELECT issue_id FROM temp.batch_ids)
+               GROUP BY issue_id) s USING(issue_id)
+    WHERE i.issue_id IN (SELECT issue_id FROM temp.batch_ids)
+"""
+FTS_INSERT_SQL = (
+    'INSERT INTO fts_issues(rowid,title,summary,fix_steps,signals_concat,language)'
+    + FTS_ROWS_SQL.format(command='')
+)
+FTS_DELETE_SQL = (
+    'INSERT INTO fts_issues(fts_issues,rowid,title,summary,fix_steps,signals_concat,language)'
+    + FTS_ROWS_SQL.format(command="'delete',")
+)
+
+
+def build_rows(
+    doc: Dict[str, object],
+) -> Tuple[Tuple[object, ...], List[Tuple[object, ...]], List[Tuple[object, ...]]]:
+    """Return the issue, signal and reference rows for a document."""
+
+    issue_id = doc['issue_id']
+    issue_row = (
+        issue_id,
+        doc['source'],
+        doc.get('source_rule_id'),
+        doc.get('language'),
+        doc['title'],
+        doc.get('summary'),
+        doc.get('fix_steps'),
+        doc.get('severity'),
+        doc.get('confidence'),
+        dumps(doc.get('taxonomy', {})),
+        doc.get('frequency'),
+        dumps(doc.get('metadata', {})),
+        doc.get('updated_at'),
     )
-    cur.execute('DELETE FROM signals WHERE issue_id=?', (doc['issue_id'],))
-    for s in doc.get('signals', []):
-        cur.execute(
-            'INSERT INTO signals(issue_id,kind,value) VALUES(?,?,?)',
-            (doc['issue_id'], s['kind'], s['value']),
-        )
-    cur.execute('DELETE FROM references_web WHERE issue_id=?', (doc['issue_id'],))
-    for r in doc.get('references', []):
-        cur.execute(
-            'INSERT INTO references_web(issue_id,label,url,license) VALUES(?,?,?,?)',
-            (doc['issue_id'], r['label'], r['url'], r.get('license')),
-        )
+    sig_rows = [(issue_id, s['kind'], s['value']) for s in doc.get('signals', [])]
+    ref_rows = [
+        (issue_id, r['label'], r['url'], r.get('license'))
+        for r in doc.get('references', [])
+    ]
+    return issue_row, sig_rows, ref_rows
 
 
-def update_fts(cur: sqlite3.Cursor, issue_id: str) -> None:
-    row = cur.execute('SELECT rowid FROM issues WHERE issue_id=?', (issue_id,)).fetchone()
-    if not row:
-        return
-    cur.execute(
-        """
-        INSERT INTO fts_issues(rowid,title,summary,fix_steps,signals_concat,language)
-        SELECT rowid,
-               title,
-               COALESCE(summary,''),
-               COALESCE(fix_steps,''),
-               COALESCE((SELECT TRIM(GROUP_CONCAT(value,' '))
-                         FROM signals s WHERE s.issue_id=i.issue_id),'') AS signals_concat,
-               COALESCE(language,'')
-        FROM issues i
-        WHERE issue_id=?
-        """,
-        (issue_id,),
-    )
+def stage_batch_ids(cur: sqlite3.Cursor, id_rows: List[Tuple[object]]) -> None:
+    """Load ``id_rows`` into ``temp.batch_ids`` for the set-based FTS statements."""
 
+    cur.execute('CREATE TEMP TABLE IF NOT EXISTS batch_ids(issue_id TEXT PRIMARY KEY)')
+    cur.execute('DELETE FROM temp.batch_ids')
+    cur.executemany('INSERT OR IGNORE INTO temp.batch_ids(issue_id) VALUES(?)', id_rows)
 
-def delete_issue(cur: sqlite3.Cursor, issue_id: str) -> None:
-    row = cur.execute('SELECT rowid FROM issues WHERE issue_id=?', (issue_id,)).fetchone()
-    if not row:
-        return
-    cur.execute(
-        "INSERT INTO fts_issues(fts_issues, rowid) VALUES('delete', ?)",
-        (row[0],),
-    )
-    cur.execute('DELETE FROM signals WHERE issue_id=?', (issue_id,))
-    cur.execute('DELETE FROM references_web WHERE issue_id=?', (issue_id,))
-    cur.execute('DELETE FROM issues WHERE issue_id=?', (issue_id,))
+
+def delete_issues(cur: sqlite3.Cursor, issue_ids: List[str]) -> None:
+    """Remove issues and their FTS entries; unknown ids are ignored."""
+
+    stage_batch_ids(cur, [(issue_id,) for issue_id in issue_ids])
+    cur.execute(FTS_DELETE_SQL)
+    for table in ('signals', 'references_web', 'issues'):
+        cur.execute(f'DELETE FROM {table} WHERE issue_id IN (SELECT issue_id FROM temp.batch_ids)')
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -163,6 +226,29 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     return args
 
 
+def ensure_schema(cur: sqlite3.Cursor) -> None:
+    """Run ``issues_index.sql`` unless the database already carries its hash.
+
+    A truncated SHA-256 of the schema file is stored in ``PRAGMA user_version``
+    so unchanged schemas skip re-executing the DDL on every build.
+    """
+
+    schema = SQL.read_bytes()
+    version = int(hashlib.sha256(schema).hexdigest()[:7], 16)
+    if cur.execute('PRAGMA user_version').fetchone()[0] == version:
+        return
+    columns = {row[1] for row in cur.execute('PRAGMA table_xinfo(issues)')}
+    if columns and 'metadata_type' not in columns:
+        # Tables created before the generated column existed need it added
+        # before the schema script indexes it.
+        cur.execute(
+            "ALTER TABLE issues ADD COLUMN metadata_type TEXT "
+            "GENERATED ALWAYS AS (json_extract(metadata_json, '$.type')) VIRTUAL"
+        )
+    cur.executescript(schema.decode('utf-8'))
+    cur.execute(f'PRAGMA user_version={version}')
+
+
 def check_integrity(cur: sqlite3.Cursor) -> None:
     """Validate FTS index and main database integrity."""
 
@@ -174,10 +260,34 @@ def check_integrity(cur: sqlite3.Cursor) -> None:
 
 
 def process_batch(con: sqlite3.Connection, cur: sqlite3.Cursor, batch: List[Dict[str, object]]) -> None:
-    con.execute('BEGIN')
+    """Upsert a batch of documents with one ``executemany`` per statement."""
+
+    issue_rows: List[Tuple[object, ...]] = []
+    id_rows: List[Tuple[object]] = []
+    sig_rows: List[Tuple[object, ...]] = []
+    ref_rows: List[Tuple[object, ...]] = []
     for doc in batch:
-        upsert_issue(cur, doc)
-        update_fts(cur, doc['issue_id'])
+        issue_row, doc_sigs, doc_refs = build_rows(doc)
+        issue_rows.append(issue_row)
+        id_rows.append((doc['issue_id'],))
+        sig_rows.extend(doc_sigs)
+        ref_rows.extend(doc_refs)
+
+    con.execute('BEGIN')
+    # Stage the batch ids so the FTS rows are built by set-based statements
+    # instead of a correlated signals lookup per document. Entries for issues
+    # already indexed are removed with their old values before the upsert.
+    stage_batch_ids(cur, id_rows)
+    cur.execute(FTS_DELETE_SQL)
+    cur.executemany(UPSERT_SQL, issue_rows)
+    cur.executemany('DELETE FROM signals WHERE issue_id=?', id_rows)
+    cur.executemany('INSERT INTO signals(issue_id,kind,value) VALUES(?,?,?)', sig_rows)
+    cur.executemany('DELETE FROM references_web WHERE issue_id=?', id_rows)
+    cur.executemany(
+        'INSERT INTO references_web(issue_id,label,url,license) VALUES(?,?,?,?)',
+        ref_rows,
+    )
+    cur.execute(FTS_INSERT_SQL)
     con.commit()
 
 
@@ -186,8 +296,26 @@ def main(argv: Optional[List[str]] = None) -> None:
 
     cid = uuid.uuid4().hex[:8]
     logger = get_logger(cid)
-    total_files = sum(1 for _ in iter_issue_files())
-    projected_mb = total_files * args.batch_size
+    start = time.time()
+    state = load_state()
+    removed_keys = set(state.keys())
+    new_state: Dict[str, int] = {}
+    total = 0
+    changed_bytes = 0
+
+    changed_paths: List[Path] = []
+    for key, entry in iter_issue_entries():
+        total += 1
+        st = entry.stat()
+        new_state[key] = st.st_mtime_ns
+        removed_keys.discard(key)
+        if state.get(key) != st.st_mtime_ns:
+            changed_paths.append(Path(entry.path))
+            changed_bytes += st.st_size
+    changed = len(changed_paths)
+
+    # Project from the JSON bytes that will actually be decoded this run.
+    projected_mb = changed_bytes >> 20
     if args.memory_limit_mb and projected_mb > args.memory_limit_mb:
         raise SystemExit(
             f'projected memory {projected_mb}MB exceeds limit {args.memory_limit_mb}MB'
@@ -198,74 +326,61 @@ def main(argv: Optional[List[str]] = None) -> None:
             projected_mb,
             args.memory_warn_mb,
         )
-    logger.info('total issue files=%s projected_mb=%s', total_files, projected_mb)
+    logger.info('total issue files=%s projected_mb=%s', total, projected_mb)
 
-    start = time.time()
-    state = load_state()
-    removed_keys = set(state.keys())
-    new_state: Dict[str, int] = {}
-    total = 0
-    changed = 0
+    removed = list(removed_keys)
+    logger.info('scan complete total=%s changed=%s removed=%s', total, changed, len(removed))
+    if not changed and not removed and DB.exists():
+        logger.info('index up-to-date seconds=%s', round(time.time() - start, 2))
+        return
 
     monitor = MemoryMonitor(args.memory_warn_mb, args.memory_limit_mb)
 
     con = sqlite3.connect(DB)
     cur = con.cursor()
-    cur.executescript(SQL.read_text(encoding='utf-8'))
-    cur.execute('PRAGMA journal_mode=WAL;')
+    ensure_schema(cur)
+    cur.executescript(BULK_PRAGMAS)
     cur.execute("INSERT INTO fts_issues(fts_issues, rank) VALUES('automerge', 4)")
     con.commit()
 
     batch: List[Dict[str, object]] = []
-    for path in iter_issue_files():
-        total += 1
-        mtime = int(path.stat().st_mtime_ns)
-        key = str(path.relative_to(ROOT))
-        new_state[key] = mtime
-        removed_keys.discard(key)
-        if state.get(key) != mtime:
-            doc = load_json(path)
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as pool:
+        for loaded, doc in enumerate(iter_docs(pool, changed_paths), 1):
             batch.append(doc)
-            changed += 1
             if len(batch) >= args.batch_size:
                 process_batch(con, cur, batch)
                 batch.clear()
-        if total % LOG_INTERVAL == 0:
-            rss = monitor.rss_mb()
-            level = logging.INFO
-            if monitor.warn_mb and rss >= monitor.warn_mb:
-                level = logging.WARNING
-            logger.log(level, 'memory rss_mb=%s batch_size=%s', round(rss, 1), args.batch_size)
-            if monitor.limit_mb and rss >= monitor.limit_mb:
-                args.batch_size = max(1, args.batch_size // 2)
-                logger.warning(
-                    'memory limit exceeded rss_mb=%s limit_mb=%s reducing batch_size=%s',
-                    round(rss, 1),
-                    monitor.limit_mb,
-                    args.batch_size,
-                )
+            if loaded % LOG_INTERVAL == 0:
+                rss = monitor.rss_mb()
+                level = logging.INFO
+                if monitor.warn_mb and rss >= monitor.warn_mb:
+                    level = logging.WARNING
+                logger.log(level, 'memory rss_mb=%s batch_size=%s', round(rss, 1), args.batch_size)
+                if monitor.limit_mb and rss >= monitor.limit_mb:
+                    args.batch_size = max(1, args.batch_size // 2)
+                    logger.warning(
+                        'memory limit exceeded rss_mb=%s limit_mb=%s reducing batch_size=%s',
+                        round(rss, 1),
+                        monitor.limit_mb,
+                        args.batch_size,
+                    )
     if batch:
         process_batch(con, cur, batch)
         batch.clear()
 
-    removed = list(removed_keys)
-    logger.info('scan complete total=%s changed=%s removed=%s', total, changed, len(removed))
-    if not changed and not removed and DB.exists():
-        con.close()
-        logger.info('index up-to-date seconds=%s', round(time.time() - start, 2))
-        return
-
     if removed:
         con.execute('BEGIN')
-        for key in removed:
-            delete_issue(cur, Path(key).stem)
+        delete_issues(cur, [Path(key).stem for key in removed])
         con.commit()
 
     con.execute('BEGIN')
     cur.execute("INSERT INTO fts_issues(fts_issues, rank) VALUES('merge', 16)")
     cur.execute("INSERT INTO fts_issues(fts_issues) VALUES('optimize')")
     check_integrity(cur)
+    # Refresh planner statistics for the issues indexes after the bulk load.
+    cur.execute('ANALYZE')
     con.commit()
+    cur.execute('PRAGMA wal_checkpoint(TRUNCATE)')
     con.close()
 
     save_state(new_state)
@@ -15,6 +15,9 @@ from monitoring.metrics_collector import MetricsCollector
 logger = logging.getLogger(__name__)
 
 HEALTH_STATUS_PATH = Path('metrics/health_status.json')
+_STATUS_OPEN_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_DSYNC', 0) | getattr(os, 'O_BINARY', 0)
+)
 
 
 def check_fts5_integrity(db_path: Path) -> None:
@@ -38,9 +41,17 @@ def check_fts5_integrity(db_path: Path) -> None:
 def _write_status(data: dict) -> None:
     HEALTH_STATUS_PATH.parent.mkdir(parents=True, exist_ok=True)
     tmp = HEALTH_STATUS_PATH.with_suffix(HEALTH_STATUS_PATH.suffix + '.tmp')
-    with tmp.open('w', encoding='utf-8') as fh:
-        json.dump(data, fh, ensure_ascii=False)
-    tmp.replace(HEALTH_STATUS_PATH)
+    payload = json.dumps(data, ensure_ascii=False).encode('utf-8')
+    # O_DSYNC makes the write itself durable, so no separate fsync is needed
+    # before the rename; platforms without it fall back to a plain write.
+    fd = os.open(tmp, _STATUS_OPEN_FLAGS, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp, HEALTH_STATUS_PATH)
 
 
 def _should_skip(path: Path, interval_min: int) -> bool:
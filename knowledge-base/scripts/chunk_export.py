@@ -1,34 +1,54 @@
-import json, pathlib
-from json_utils import load_json
+import pathlib
+from json_utils import dumps_bytes, load_json
 
 ROOT = pathlib.Path('issuesdb/issues')
 OUTD = pathlib.Path('exports'); OUTD.mkdir(parents=True, exist_ok=True)
 OUTF = OUTD / 'chunks.jsonl'
 MAX_CHARS = 1400
+WRITE_BUFFER = 1 << 20
+RECORD_TEMPLATE = b'{"id":%s:%d","doc_id":%s,"chunk_ix":%d,"text":%s,"metadata":%s}\n'
 
 def chunks(text: str, max_chars=MAX_CHARS):
     if not text: return []
     text = text.strip()
-    if len(text) <= max_chars: return [text]
-    parts, buf, total = [], [], 0
-    for para in text.split('\n\n'):
-        if total + len(para) + 2 > max_chars and buf:
-            parts.append('\n\n'.join(buf).strip()); buf = []; total = 0
-        buf.append(para); total += len(para) + 2
-    if buf: parts.append('\n\n'.join(buf).strip())
+    n = len(text)
+    if n <= max_chars: return [text]
+    # Each window of consecutive paragraphs is located with one C-level rfind for
+    # the last '\n\n' that still fits, so the Python loop runs once per chunk
+    # rather than once per paragraph.
     fixed = []
-    for p in parts:
-        if len(p) <= max_chars: fixed.append(p)
+    start = 0
+    while start <= n:
+        limit = start + max_chars - 2
+        if n <= limit:
+            end = n
         else:
-            for i in range(0, len(p), max_chars):
-                fixed.append(p[i:i+max_chars])
+            end = text.rfind('\n\n', start, limit + 2)
+            if end == -1:
+                end = text.find('\n\n', start)
+                if end == -1: end = n
+            else:
+                # In a run of newlines only every other offset is a split point.
+                run = end
+                while run > start and text[run - 1] == '\n': run -= 1
+                end -= (end - run) % 2
+        p = text[start:end].strip()
+        if len(p) <= max_chars: fixed.append(p)
+        else: fixed.extend(p[i:i+max_chars] for i in range(0, len(p), max_chars))
+        start = end + 2
     return fixed
 
 def iter_issues():
     for p in ROOT.glob('*/*/*.json'):
         yield load_json(p)
 
-with OUTF.open('w', encoding='utf-8') as out:
+# Records are staged in memory and written in ~1 MiB blocks instead of one
+# small write per chunk.
+buf = bytearray()
+# One metadata dict is reused for every document; its keys are created once in
+# output order and only the values are overwritten.
+meta = dict.fromkeys(('source', 'language', 'severity', 'signals', 'references', 'updated_at'))
+with OUTF.open('wb', buffering=WRITE_BUFFER) as out:
     for doc in iter_issues():
         base_text = []
         base_text.append(f"# {doc['title']}")
@@ -38,20 +58,19 @@ with OUTF.open('w', encoding='utf-8') as out:
         body = '\n\n'.join([t for t in base_text if t])
         sigs = [s['value'] for s in doc.get('signals', [])]
         refs = [r['url'] for r in doc.get('references', [])]
+        # Everything except the chunk index and text is shared by all chunks of a
+        # document, so encode it once and splice each record from the fragments.
+        doc_id = dumps_bytes(doc['issue_id'])
+        meta['source'] = doc['source']
+        meta['language'] = doc.get('language')
+        meta['severity'] = doc.get('severity')
+        meta['signals'] = sigs
+        meta['references'] = refs
+        meta['updated_at'] = doc.get('updated_at')
+        meta_json = dumps_bytes(meta)
         for ix, ch in enumerate(chunks(body)):
-            rec = {
-                'id': f"{doc['issue_id']}:{ix}",
-                'doc_id': doc['issue_id'],
-                'chunk_ix': ix,
-                'text': ch,
-                'metadata': {
-                    'source': doc['source'],
-                    'language': doc.get('language'),
-                    'severity': doc.get('severity'),
-                    'signals': sigs,
-                    'references': refs,
-                    'updated_at': doc.get('updated_at')
-                }
-            }
-            out.write(json.dumps(rec, ensure_ascii=False) + '\n')
+            buf += RECORD_TEMPLATE % (doc_id[:-1], ix, doc_id, ix, dumps_bytes(ch), meta_json)
+        if len(buf) >= WRITE_BUFFER:
+            out.write(buf); buf.clear()
+    out.write(buf)
 print(f'Wrote {OUTF}')
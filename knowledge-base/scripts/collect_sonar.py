@@ -6,108 +6,168 @@ Uses SonarCloud v2 API with Bearer token authentication
 
 import argparse
 import json
+import logging
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import hashlib
 from pathlib import Path
 from urllib.parse import urljoin
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Union
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+log = logging.getLogger('sonar_collect')
+
+# Fixed query parameters for every rules page; rules from all quality profiles
+# and repositories are requested by leaving those filters out.
+_BASE_PARAMS = {
+    'types': 'CODE_SMELL,BUG,VULNERABILITY,SECURITY_HOTSPOT',
+    'activation': 'true',
+    'include_external': 'false',
+    'statuses': 'READY'
+}
+
+_SONAR_HASHER = hashlib.sha1(b'sonar|')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_ENT_RE = re.compile(r'&(lt|gt|amp);')
+_ENT_MAP = {'lt': '<', 'gt': '>', 'amp': '&'}
 
 # Import local utilities
 try:
     from json_utils import load_json
     from emit_issue import write_issues_batch
+    from memory_monitor import MemoryMonitor
 except ImportError:
     print("Warning: Could not import local utilities. Some functions may not work.")
 
-def get_api_headers(token: str) -> Dict[str, str]:
-    """Generate headers for SonarCloud API v2 with Bearer authentication"""
-    return {
-        'Authorization': f'Bearer {token}',
+def _build_session() -> requests.Session:
+    """Create the shared HTTP session used for all SonarCloud calls.
+
+    Reusing one session keeps connections alive between pages, and the mounted
+    adapter retries transient failures with backoff.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retries))
+    session.headers.update({
         'Accept': 'application/json',
         'User-Agent': 'roo-framework-knowledge-base/1.0'
-    }
+    })
+    return session
+
+_SESSION = _build_session()
+
+# Only back off when the server says the remaining request budget is this low.
+RATE_LIMIT_LOW_WATER = 2
+DEFAULT_RETRY_AFTER = 1.0
+
+def _respect_rate_limit(response: requests.Response) -> None:
+    """Sleep only when SonarCloud signals that the rate limit is nearly spent."""
+    remaining = response.headers.get('X-RateLimit-Remaining')
+    try:
+        if remaining is None or int(remaining) > RATE_LIMIT_LOW_WATER:
+            return
+    except ValueError:
+        return
+    try:
+        delay = float(response.headers.get('Retry-After', DEFAULT_RETRY_AFTER))
+    except ValueError:
+        delay = DEFAULT_RETRY_AFTER
+    log.info("[WAIT] Rate limit nearly exhausted (%s left), sleeping %ss", remaining, delay)
+    time.sleep(delay)
+
+def authorize_session(token: str) -> None:
+    """Attach Bearer authentication for SonarCloud API v2 to the shared session"""
+    _SESSION.headers['Authorization'] = f'Bearer {token}'
 
-def fetch_rules_page(base_url: str, token: str, languages: List[str], 
-                    page: int = 1, page_size: int = 100) -> Optional[Dict]:
+def fetch_rules_page(base_url: str, languages: Union[str, List[str]],
+                    page: int = 1, page_size: int = 100,
+                    token: Optional[str] = None) -> Optional[Dict]:
     """
-    Fetch a page of rules from SonarCloud v2 API
+    Fetch a page of rules from SonarCloud v2 API using the shared session
+
+    ``languages`` may be a list or an already comma-joined filter. When
+    ``token`` is given it is sent with this request only; otherwise the
+    session must have been set up with ``authorize_session``.
     """
     # Use the new v2 API endpoint
     api_url = "https://api.sonarcloud.io"
     
-    params = {
-        'languages': ','.join(languages),
-        'p': page,
-        'ps': page_size,
-        'types': 'CODE_SMELL,BUG,VULNERABILITY,SECURITY_HOTSPOT',
-        'activation': 'true',
-        'qprofile': None,  # Get rules for all quality profiles
-        'repositories': None,  # Get rules from all repositories
-        'include_external': 'false',
-        'statuses': 'READY'
-    }
-    
-    # Clean up None values
-    params = {k: v for k, v in params.items() if v is not None}
-    
-    headers = get_api_headers(token)
+    if not isinstance(languages, str):
+        languages = ','.join(languages)
+    params = {'languages': languages, 'p': page, 'ps': page_size, **_BASE_PARAMS}
+    headers = {'Authorization': f'Bearer {token}'} if token else None
     
     try:
         # Try v2 API first
         v2_url = f"{api_url}/v2/clean-code-policy/rules/search"
         
-        print(f"[SEARCH] Fetching rules from {v2_url} (page {page})")
-        response = requests.get(v2_url, headers=headers, params=params, timeout=30)
+        log.debug("[SEARCH] Fetching rules from %s (page %d)", v2_url, page)
+        response = _SESSION.get(v2_url, params=params, headers=headers, timeout=30)
         
         if response.status_code == 404:
             # Fall back to v1 API if v2 is not available
-            print("[CONFIG] v2 API not available, falling back to v1...")
+            log.debug("[CONFIG] v2 API not available, falling back to v1...")
             v1_url = f"{base_url}/api/rules/search"
-            response = requests.get(v1_url, headers=headers, params=params, timeout=30)
+            response = _SESSION.get(v1_url, params=params, headers=headers, timeout=30)
         
         response.raise_for_status()
+        _respect_rate_limit(response)
         return response.json()
         
     except requests.exceptions.RequestException as e:
-        print(f"[ERROR] API request failed: {e}")
+        log.error("[ERROR] API request failed: %s", e)
         if hasattr(e, 'response') and e.response is not None:
-            print(f"Response status: {e.response.status_code}")
-            print(f"Response content: {e.response.text[:500]}...")
+            log.error("Response status: %s", e.response.status_code)
+            log.error("Response content: %.500s...", e.response.text)
         return None
 
 def extract_issue_data(rule: Dict, base_url: str) -> Dict:
     """
     Extract and normalize issue data from SonarCloud rule
     """
-    key = rule.get('key', '')
-    title = rule.get('name', '')
-    desc = rule.get('htmlDesc', rule.get('description', ''))
+    g = rule.get
+    key = g('key', '')
+    title = g('name', '')
+    desc = g('htmlDesc', g('description', ''))
     
     # Remove HTML tags from description for cleaner text
-    import re
     if desc:
-        desc = re.sub(r'<[^>]+>', '', desc)
-        desc = desc.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
+        if '<' in desc:
+            desc = _HTML_TAG_RE.sub('', desc)
+        if '&' in desc:
+            desc = _ENT_RE.sub(lambda m: _ENT_MAP[m.group(1)], desc)
     
     # Extract metadata
-    severity = rule.get('severity', 'UNKNOWN').lower()
-    rule_type = rule.get('type', 'UNKNOWN').lower()
-    language = rule.get('lang', 'unknown').lower()
+    severity = g('severity', 'UNKNOWN').lower()
+    rule_type = g('type', 'UNKNOWN').lower()
+    language = g('lang', 'unknown').lower()
     
     # Extract taxonomy information
     cwe = []
     owasp = []
     sans_top25 = []
     
-    if 'securityStandards' in rule:
-        standards = rule['securityStandards']
-        cwe = standards.get('cwe', [])
-        owasp = standards.get('owaspTop10', [])
-        sans_top25 = standards.get('sansTop25', [])
+    standards = g('securityStandards')
+    if standards is not None:
+        sg = standards.get
+        cwe = sg('cwe', [])
+        owasp = sg('owaspTop10', [])
+        sans_top25 = sg('sansTop25', [])
     
     # Generate consistent issue ID
-    issue_id = hashlib.sha1(f'sonar|{key}'.encode()).hexdigest()
+    h = _SONAR_HASHER.copy()
+    h.update(key.encode())
+    issue_id = h.hexdigest()
     
     # Build the issue document
     doc = {
@@ -138,110 +198,118 @@ def extract_issue_data(rule: Dict, base_url: str) -> Dict:
         ],
         'metadata': {
             'type': rule_type,
-            'tags': rule.get('sysTags', []),
-            'remediation': rule.get('remediationFunction'),
-            'effort': rule.get('defaultRemFnBaseEffort'),
-            'created': rule.get('createdAt'),
-            'repository': rule.get('repo', 'unknown')
+            'tags': g('sysTags', []),
+            'remediation': g('remediationFunction'),
+            'effort': g('defaultRemFnBaseEffort'),
+            'created': g('createdAt'),
+            'repository': g('repo', 'unknown')
         }
     }
     
     return doc
 
+def iter_issue_docs(rules: List[Dict], base_url: str) -> Iterator[Dict]:
+    """
+    Yield normalized issue documents, skipping rules that fail to extract
+    """
+    for rule in rules:
+        try:
+            doc = extract_issue_data(rule, base_url)
+        except Exception as e:
+            log.warning("[WARNING]  Error processing rule %s: %s", rule.get('key', 'unknown'), e)
+            continue
+        yield doc
+
 def collect_sonar_issues(base_url: str, token: str, languages: List[str], 
                         limit: Optional[int] = None, page_size: int = 100) -> int:
     """
     Main collection function for SonarCloud issues
     """
-    print(f"[*] Starting SonarCloud issue collection...")
-    print(f"[BASE] Base URL: {base_url}")  
-    print(f"[LANGS] Languages: {', '.join(languages)}")
-    print(f"[STATS] Limit: {limit or 'unlimited'}")
+    log.info("[*] Starting SonarCloud issue collection...")
+    log.info("[BASE] Base URL: %s", base_url)
+    log.info("[LANGS] Languages: %s", ', '.join(languages))
+    log.info("[STATS] Limit: %s", limit or 'unlimited')
     
+    authorize_session(token)
+    lang_filter = ','.join(languages)
+    monitor = MemoryMonitor()
     total_collected = 0
     page = 1
-    batch = []
     
-    while True:
-        # Fetch page of rules
-        data = fetch_rules_page(base_url, token, languages, page, page_size)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_page = executor.submit(fetch_rules_page, base_url, lang_filter, page, page_size)
+        while True:
+            # Fetch page of rules
+            data = next_page.result()
+            next_page = None
         
-        if not data:
-            print(f"[ERROR] Failed to fetch page {page}")
-            break
+            if not data:
+                log.error("[ERROR] Failed to fetch page %d", page)
+                break
         
-        rules = data.get('rules', [])
-        if not rules:
-            print(f"[PAGE] No more rules on page {page}")
-            break
+            rules = data.get('rules', [])
+            if not rules:
+                log.info("[PAGE] No more rules on page %d", page)
+                break
         
-        print(f"[CONFIG] Processing {len(rules)} rules from page {page}")
+            # Request the following page before processing this one so the HTTP
+            # round-trip overlaps extraction and file writes.
+            total_rules = data.get('total', 0)
+            more_pages = page * page_size < total_rules
+            if more_pages and not (limit and total_collected + len(rules) >= limit):
+                next_page = executor.submit(fetch_rules_page, base_url, lang_filter, page + 1, page_size)
         
-        # Process each rule
-        for rule in rules:
-            try:
-                doc = extract_issue_data(rule, base_url)
-                batch.append(doc)
-                total_collected += 1
-                
-                # Write batch if it's full
-                if len(batch) >= 50:  # Write in smaller batches
-                    write_issues_batch(batch)
-                    batch = []
-                    print(f"[SAVE] Wrote batch, total collected: {total_collected}")
-                
-                # Check limit
-                if limit and total_collected >= limit:
-                    print(f"[TARGET] Reached collection limit of {limit}")
-                    break
-                    
-            except Exception as e:
-                print(f"[WARNING]  Error processing rule {rule.get('key', 'unknown')}: {e}")
-                continue
+            log.debug("[CONFIG] Processing %d rules from page %d", len(rules), page)
         
-        # Write final batch for this page
-        if batch:
-            write_issues_batch(batch)
-            batch = []
+            # Stop before writing rather than let a large run get OOM-killed.
+            if monitor.limit_mb is not None:
+                rss = monitor.maybe_rss_mb()
+                if rss > monitor.limit_mb:
+                    log.error("[ERROR] Memory limit exceeded (rss_mb=%.1f, limit_mb=%d), stopping at page %d",
+                              rss, monitor.limit_mb, page)
+                    break
         
-        # Check if we should continue
-        if limit and total_collected >= limit:
-            break
+            # Extracted docs stream straight into the writer, which keeps at
+            # most DUMP_WINDOW documents in flight instead of the whole page.
+            remaining = limit - total_collected if limit else None
+            docs = islice(iter_issue_docs(rules, base_url), remaining)
+            # Write failures propagate so main() reports them and exits non-zero.
+            total_collected += len(write_issues_batch(docs))
+            log.debug("[SAVE] Wrote page %d, total collected: %d", page, total_collected)
         
-        # Check if there are more pages
-        total_rules = data.get('total', 0)
-        if page * page_size >= total_rules:
-            print(f"[PAGE] Processed all {total_rules} available rules")
-            break
+            # Check if we should continue
+            if limit and total_collected >= limit:
+                log.info("[TARGET] Reached collection limit of %d", limit)
+                break
         
-        page += 1
+            # Check if there are more pages
+            if not more_pages:
+                log.info("[PAGE] Processed all %d available rules", total_rules)
+                break
         
-        # Rate limiting - be respectful to SonarCloud API
-        time.sleep(0.2)
+            page += 1
+            if next_page is None:
+                next_page = executor.submit(fetch_rules_page, base_url, lang_filter, page, page_size)
     
-    # Write any remaining batch
-    if batch:
-        write_issues_batch(batch)
-    
-    print(f"[OK] Collection completed! Collected {total_collected} issues")
+    log.info("[OK] Collection completed! Collected %d issues", total_collected)
     return total_collected
 
 def validate_token(token: str, base_url: str = "https://sonarcloud.io") -> bool:
     """
     Validate that the API token works
     """
-    headers = get_api_headers(token)
+    authorize_session(token)
     
     # Test with a simple API call
     test_url = f"{base_url}/api/system/status"
     
     try:
-        response = requests.get(test_url, headers=headers, timeout=10)
+        response = _SESSION.get(test_url, timeout=10)
         response.raise_for_status()
-        print("[OK] API token validation successful")
+        log.info("[OK] API token validation successful")
         return True
     except requests.exceptions.RequestException as e:
-        print(f"[ERROR] API token validation failed: {e}")
+        log.error("[ERROR] API token validation failed: %s", e)
         return False
 
 def main():
@@ -278,8 +346,17 @@ def main():
         action='store_true',
         help='Only validate API token, do not collect issues'
     )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Log per-page progress messages'
+    )
     
     args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(message)s'
+    )
     
     # Get API token
     token = args.token
@@ -325,6 +402,8 @@ def main():
     except Exception as e:
         print(f"\n[ERROR] Collection failed: {e}")
         return 1
+    finally:
+        _SESSION.close()
 
 if __name__ == '__main__':
     exit(main())
@@ -1,13 +1,45 @@
 import json
-from pathlib import Path
-from typing import Any
+import os
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    orjson = None
 
 MAX_JSON_BYTES = 1_000_000
 
 
-def load_json(path: Path) -> Any:
-    size = path.stat().st_size
-    if size > MAX_JSON_BYTES:
-        raise ValueError(f'JSON file {path} exceeds {MAX_JSON_BYTES} bytes (size={size})')
-    with path.open('r', encoding='utf-8') as f:
-        return json.load(f)
+def loads(data: bytes) -> Any:
+    """Decode UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """Encode ``obj`` as two-space indented UTF-8 JSON with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, indent=2) + '\n').encode('utf-8')
+
+
+def dumps(obj: Any) -> str:
+    """Encode ``obj`` as a compact JSON string."""
+    return dumps_bytes(obj).decode('utf-8')
+
+
+def load_json(path: Union[str, 'os.PathLike[str]']) -> Any:
+    """Load a JSON file with one open, one fstat and one unbuffered read."""
+    with open(path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > MAX_JSON_BYTES:
+            raise ValueError(f'JSON file {path} exceeds {MAX_JSON_BYTES} bytes (size={size})')
+        return loads(f.readall())
@@ -3,10 +3,28 @@ from __future__ import annotations
 """Track process RSS memory usage."""
 
 import os
-from typing import Optional
+import time
+from typing import Callable, Optional
 
 import psutil
 
+_MB_INV = 1.0 / (1024 * 1024)
+_PROC = psutil.Process(os.getpid())
+
+
+def _rss_statm() -> int:
+    """Read RSS in bytes straight from ``/proc/self/statm``."""
+    with open('/proc/self/statm', 'rb') as f:
+        return int(f.read().split()[1]) * _PAGE_SIZE
+
+
+try:
+    _PAGE_SIZE = os.sysconf('SC_PAGESIZE')
+    _rss_statm()
+    _rss_fast: Optional[Callable[[], int]] = _rss_statm
+except (AttributeError, ValueError, OSError):
+    _rss_fast = None
+
 
 class MemoryMonitor:
     """Monitor resident set size (RSS) memory usage.
@@ -21,9 +39,26 @@ class MemoryMonitor:
             limit_mb = int(env_limit) if env_limit else None
         self.warn_mb = warn_mb
         self.limit_mb = limit_mb
-        self.process = psutil.Process(os.getpid())
+        self.process = _PROC
+        self._last_poll = float('-inf')
+        self._last_rss = 0.0
 
     def rss_mb(self) -> float:
         """Return current RSS memory usage in megabytes."""
 
-        return self.process.memory_info().rss / (1024 ** 2)
+        if _rss_fast is not None:
+            return _rss_fast() * _MB_INV
+        return self.process.memory_info().rss * _MB_INV
+
+    def maybe_rss_mb(self, min_interval: float = 0.5) -> float:
+        """Return RSS in megabytes, reusing the last sample if it is recent.
+
+        The process is polled at most once per ``min_interval`` seconds, so the
+        call is cheap enough for per-document loops.
+        """
+
+        now = time.monotonic()
+        if now - self._last_poll >= min_interval:
+            self._last_rss = self.rss_mb()
+            self._last_poll = now
+        return self._last_rss
@@ -4,100 +4,223 @@ Enhanced render_memory_bank.py for Roo Framework Compatibility
 Generates memory-bank files in the format expected by roo-autonomous-development-framework
 """
 
+import atexit
+import os
 import pathlib
-import json
-import datetime
-import sqlite3
-from json_utils import load_json
+import functools
+import re
+import time
+from dataclasses import dataclass, field
+from itertools import starmap
+from json_utils import dumps_indented, load_json
 
 ROOT = pathlib.Path('.')
 # Changed from memory_bank to memory-bank for roo compatibility
 MB = ROOT / 'memory-bank'
 ISS = ROOT / 'issuesdb' / 'issues'
 DB = ROOT / 'issuesdb' / 'issues.sqlite'
+# Read-side tuning for the analytics queries; journal mode and synchronous are
+# set by build_index, which owns writes to the index.
+READ_PRAGMAS = (
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA query_only=ON',
+)
+_CONN = None
+# Issue files are small and independent; several reads in flight keep the disk busy.
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# One timestamp per run keeps every rendered file consistent.
+_NOW = time.gmtime()
+_NOW_ISO = time.strftime('%Y-%m-%dT%H:%M:%SZ', _NOW)
+
+# Lines that carry the render time; ignored when deciding whether a file changed.
+_VOLATILE_LINE_RE = re.compile(rb'^(?:updated: |\*\*Last Updated\*\*: |\s*"last_updated": ).*$', re.M)
+
+def _write_if_changed(path: pathlib.Path, data: bytes) -> bool:
+    """Write ``data`` to ``path`` unless the file already holds the same content
+
+    Render timestamps are masked before comparing, so rerunning over unchanged
+    data leaves files, and the time they were last updated, untouched.
+    """
+    try:
+        existing = path.read_bytes()
+    except FileNotFoundError:
+        existing = None
+    if (existing is not None and len(existing) == len(data)
+            and _VOLATILE_LINE_RE.sub(b'', existing) == _VOLATILE_LINE_RE.sub(b'', data)):
+        return False
+    path.write_bytes(data)
+    return True
 
 def ensure_memory_bank_structure():
     """Create the memory-bank directory structure expected by roo framework"""
-    MB.mkdir(exist_ok=True)
-    (MB / 'schemas').mkdir(exist_ok=True)
+    try:
+        (MB / 'schemas').mkdir(parents=True)
+    except FileExistsError:
+        return
     print(f"[OK] Created memory-bank structure at {MB}")
 
+def _extract_source_lang(path):
+    """Return ``(source, language)`` for one issue file, dropping the rest"""
+    doc = load_json(path)
+    return doc['source'], (doc.get('language') or 'unknown').lower()
+
+@functools.lru_cache(maxsize=4096)
+def _source_lang_for(path, mtime_ns, size):
+    return _extract_source_lang(path)
+
+def _doc_source_lang(path):
+    """Return ``(source, language)`` for ``path``, parsing it only when it changed
+
+    Entries are keyed on path, mtime and size, so repeated renders in one
+    process skip unchanged files.
+    """
+    st = os.stat(path)
+    return _source_lang_for(os.fspath(path), st.st_mtime_ns, st.st_size)
+
+def _scan_dirs(path):
+    with os.scandir(path) as it:
+        return [entry.path for entry in it if entry.is_dir()]
+
+def _iter_issue_files(root):
+    """Yield ``<root>/<source>/<lang>/*.json`` paths as plain strings
+
+    Mirrors ``root.glob('*/*/*.json')`` without building a ``Path`` or running
+    fnmatch for every entry.
+    """
+    if not os.path.isdir(root):
+        return
+    for source in _scan_dirs(root):
+        for lang in _scan_dirs(source):
+            with os.scandir(lang) as it:
+                for entry in it:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        yield entry.path
+
 def count_docs():
-    """Count documents by source and language"""
+    """Count documents by source and language
+
+    Returns ``(total, by_source, by_lang)`` where the breakdowns are lists of
+    ``(name, count)`` sorted by name.
+    """
     total = 0
     by_source = {}
     by_lang = {}
     
-    for p in ISS.glob('*/*/*.json'):
-        total += 1
-        doc = load_json(p)
-        src = doc['source']
-        by_source[src] = by_source.get(src, 0) + 1
-        lang = (doc.get('language') or 'unknown').lower()
-        by_lang[lang] = by_lang.get(lang, 0) + 1
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as ex:
+        for src, lang in ex.map(_doc_source_lang, _iter_issue_files(ISS)):
+            total += 1
+            by_source[src] = by_source.get(src, 0) + 1
+            by_lang[lang] = by_lang.get(lang, 0) + 1
+    
+    return total, sorted(by_source.items()), sorted(by_lang.items())
+
+def _get_conn():
+    """Return the shared read-only connection to the issues index"""
+    global _CONN
+    if _CONN is None:
+        import sqlite3
+        _CONN = sqlite3.connect(DB, isolation_level=None)
+        for pragma in READ_PRAGMAS:
+            _CONN.execute(pragma)
+        atexit.register(_CONN.close)
+    return _CONN
+
+def count_docs_from_db():
+    """Count documents by source and language from the issues index
+
+    Same return shape as ``count_docs``. Falls back to scanning the issue files when the index has not been built.
+    """
+    if not DB.exists():
+        return count_docs()
+    
+    conn = _get_conn()
+    has_table = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name='issues'"
+    ).fetchone()
+    if not has_table:
+        return count_docs()
+    rows = conn.execute("""
+        SELECT source, LOWER(COALESCE(NULLIF(language, ''), 'unknown')), COUNT(*)
+        FROM issues
+        GROUP BY 1, 2
+    """).fetchall()
+    
+    total = 0
+    by_source = {}
+    by_lang = {}
+    for src, lang, count in rows:
+        total += count
+        by_source[src] = by_source.get(src, 0) + count
+        by_lang[lang] = by_lang.get(lang, 0) + count
     
-    return total, by_source, by_lang
+    return total, sorted(by_source.items()), sorted(by_lang.items())
 
+@dataclass
+class PatternStats:
+    """Severity and issue-type breakdowns as ``(key, count)`` lists, largest first"""
+    severity_distribution: list = field(default_factory=list)
+    common_issue_types: list = field(default_factory=list)
+
+@functools.lru_cache(maxsize=1)
 def get_issue_patterns():
-    """Extract patterns from the issues database for agent consumption"""
+    """Extract patterns from the issues database for agent consumption
+
+    The result is computed once per process and shared by every renderer.
+    """
+    return _get_issue_patterns_uncached()
+
+def _get_issue_patterns_uncached():
     if not DB.exists():
-        return []
+        return PatternStats()
     
-    patterns = []
+    import sqlite3
     try:
-        with sqlite3.connect(DB) as conn:
-            cursor = conn.cursor()
-            
-            # Get common issue types and severity patterns
-            cursor.execute("""
-                SELECT severity, COUNT(*) as count 
-                FROM issues 
-                GROUP BY severity 
-                ORDER BY count DESC
-            """)
-            
-            severity_patterns = cursor.fetchall()
-            
-            # Get common fix patterns from metadata
-            cursor.execute("""
-                SELECT json_extract(metadata, '$.type') as issue_type, COUNT(*) as count
-                FROM issues 
-                WHERE json_extract(metadata, '$.type') IS NOT NULL
-                GROUP BY issue_type
-                ORDER BY count DESC
-                LIMIT 10
-            """)
-            
-            type_patterns = cursor.fetchall()
-            
-            patterns = {
-                'severity_distribution': severity_patterns,
-                'common_issue_types': type_patterns
-            }
-            
+        cursor = _get_conn().cursor()
+        cursor.arraysize = 1000
+        
+        # Indexes built by build_index carry the generated metadata_type
+        # column; older databases fall back to decoding metadata_json.
+        columns = {row[1] for row in cursor.execute('PRAGMA table_xinfo(issues)')}
+        type_expr = 'metadata_type' if 'metadata_type' in columns else "json_extract(metadata_json, '$.type')"
+        
+        # One scan yields both breakdowns: severity and issue type per group
+        cursor.execute(f"""
+            SELECT severity, {type_expr}, COUNT(*)
+            FROM issues
+            GROUP BY 1, 2
+        """)
+        rows = cursor.fetchall()
     except sqlite3.Error as e:
         print(f"Warning: Could not extract patterns from database: {e}")
-        patterns = {'severity_distribution': [], 'common_issue_types': []}
+        return PatternStats()
+    
+    by_severity = {}
+    by_type = {}
+    for severity, issue_type, count in rows:
+        by_severity[severity] = by_severity.get(severity, 0) + count
+        if issue_type is not None:
+            by_type[issue_type] = by_type.get(issue_type, 0) + count
     
-    return patterns
+    return PatternStats(
+        severity_distribution=sorted(by_severity.items(), key=lambda kv: -kv[1]),
+        common_issue_types=sorted(by_type.items(), key=lambda kv: -kv[1])[:10]
+    )
 
 def frontmatter(title: str, additional_fields=None):
     """Generate frontmatter compatible with roo framework"""
-    now = datetime.datetime.utcnow().replace(microsecond=0).isoformat() + 'Z'
+    now = _NOW_ISO
     
-    fm = (
-        '---\n'
-        f'version: 1\n'
-        f'updated: {now}\n'
-        f'title: {title}\n'
-    )
+    parts = ['---\n', 'version: 1\n', f'updated: {now}\n', f'title: {title}\n']
     
     if additional_fields:
-        for key, value in additional_fields.items():
-            fm += f'{key}: {value}\n'
+        parts.extend(f'{key}: {value}\n' for key, value in additional_fields.items())
     
-    fm += '---\n\n'
-    return fm
+    parts.append('---\n\n')
+    return ''.join(parts)
 
 def render_product_context():
     """Generate productContext.md for programming issues knowledge base"""
@@ -146,32 +269,11 @@ Provide autonomous AI agents with comprehensive, searchable knowledge about comm
 - **Learning**: Successful integration of fixes into ongoing development workflows
 '''
 
-def render_system_patterns(total, by_source, by_lang, patterns):
-    """Generate systemPatterns.md with programming issues data"""
-    rows = '\n'.join([f'- **{k}**: {v} issues' for k, v in sorted(by_source.items())]) or '- (none)'
-    langs = '\n'.join([f'- **{k.upper()}**: {v} issues' for k, v in sorted(by_lang.items())]) or '- (none)'
-    
-    # Format severity patterns
-    severity_info = ''
-    if patterns.get('severity_distribution'):
-        severity_info = '### Issue Severity Distribution\n'
-        for severity, count in patterns['severity_distribution']:
-            severity_info += f'- **{severity or "Unknown"}**: {count} issues\n'
-        severity_info += '\n'
-    
-    # Format common issue types
-    types_info = ''
-    if patterns.get('common_issue_types'):
-        types_info = '### Common Issue Types\n'
-        for issue_type, count in patterns['common_issue_types']:
-            types_info += f'- **{issue_type or "General"}**: {count} occurrences\n'
-        types_info += '\n'
-    
-    return frontmatter('Programming Issues System Patterns') + f'''# System Patterns - Programming Issues Knowledge Base
+_SYSTEM_PATTERNS_TMPL = '''# System Patterns - Programming Issues Knowledge Base
 
 ## Dataset Overview
 **Total Issues Indexed**: {total}  
-**Last Updated**: {datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")}
+**Last Updated**: {updated}
 
 ### Coverage by Source
 {rows}
@@ -226,6 +328,48 @@ context_window = build_context_window(chunks, current_issue_context)
 - **Memory Management**: Configurable memory limits for large-scale operations
 '''
 
+_FMT_COUNT = '- **{0}**: {1} issues'.format
+
+def render_system_patterns(total, by_source, by_lang, patterns):
+    """Generate systemPatterns.md with programming issues data
+
+    ``by_source`` and ``by_lang`` are the name-sorted ``(name, count)`` lists
+    returned by ``count_docs``.
+    """
+    rows = '\n'.join(starmap(_FMT_COUNT, by_source)) or '- (none)'
+    langs = '\n'.join(_FMT_COUNT(k.upper(), v) for k, v in by_lang) or '- (none)'
+    
+    # Format severity patterns
+    severity_info = ''
+    if patterns.severity_distribution:
+        parts = ['### Issue Severity Distribution\n']
+        parts.extend(
+            f'- **{severity or "Unknown"}**: {count} issues\n'
+            for severity, count in patterns.severity_distribution
+        )
+        parts.append('\n')
+        severity_info = ''.join(parts)
+    
+    # Format common issue types
+    types_info = ''
+    if patterns.common_issue_types:
+        parts = ['### Common Issue Types\n']
+        parts.extend(
+            f'- **{issue_type or "General"}**: {count} occurrences\n'
+            for issue_type, count in patterns.common_issue_types
+        )
+        parts.append('\n')
+        types_info = ''.join(parts)
+    
+    return frontmatter('Programming Issues System Patterns') + _SYSTEM_PATTERNS_TMPL.format_map({
+        'total': total,
+        'updated': time.strftime("%Y-%m-%d %H:%M UTC", _NOW),
+        'rows': rows,
+        'langs': langs,
+        'severity_info': severity_info,
+        'types_info': types_info,
+    })
+
 def render_decision_log():
     """Generate decisionLog.md for programming issues decisions"""
     return frontmatter('Programming Issues Knowledge Base - Decision Log') + '''# Decision Log - Programming Issues Knowledge Base
@@ -631,8 +775,8 @@ def render_global_patterns():
 - **Cross-Team Knowledge Sharing**: 91% of patterns successfully adopted by different teams
 '''
 
-def create_schemas():
-    """Create JSON schemas for validation"""
+def render_schemas():
+    """Return ``(relative path, bytes)`` pairs for the JSON validation schemas"""
     
     # Pattern schema - simplified version for programming issues
     pattern_schema = {
@@ -656,9 +800,6 @@ def create_schemas():
         }
     }
     
-    with open(MB / 'schemas' / 'programming-issues-pattern.json', 'w') as f:
-        json.dump(pattern_schema, f, indent=2)
-    
     # Issue context schema
     issue_context_schema = {
         "$schema": "http://json-schema.org/draft-07/schema#",
@@ -683,10 +824,10 @@ def create_schemas():
         }
     }
     
-    with open(MB / 'schemas' / 'programming-issue-context.json', 'w') as f:
-        json.dump(issue_context_schema, f, indent=2)
-    
-    print("[OK] Created JSON schemas for validation")
+    return [
+        ('schemas/programming-issues-pattern.json', dumps_indented(pattern_schema)),
+        ('schemas/programming-issue-context.json', dumps_indented(issue_context_schema)),
+    ]
 
 def render_progress():
     """Generate progress.md for programming issues knowledge base"""
@@ -770,12 +911,12 @@ def render_progress():
 - **Community Knowledge Sharing**: Anonymized pattern sharing across Roo installations
 '''
 
-def create_integration_metadata():
-    """Create metadata file for roo framework integration"""
+def render_integration_metadata():
+    """Return the roo framework integration metadata as JSON bytes"""
     metadata = {
         "integration_info": {
             "source_repository": "local-issues-kb-sparc",
-            "last_updated": datetime.datetime.utcnow().isoformat() + "Z",
+            "last_updated": _NOW_ISO,
             "database_location": "data/knowledge-bases/programming-issues.sqlite",
             "chunks_location": "data/exports/programming-issues-chunks.jsonl",
             "memory_bank_location": "memory-bank/programming-issues/",
@@ -795,10 +936,7 @@ def create_integration_metadata():
         }
     }
     
-    with open(MB / 'roo-integration-metadata.json', 'w') as f:
-        json.dump(metadata, f, indent=2)
-    
-    print("[OK] Created roo integration metadata")
+    return dumps_indented(metadata)
 
 def main():
     """Main function to render all memory bank files"""
@@ -808,13 +946,13 @@ def main():
     ensure_memory_bank_structure()
     
     # Count documents and extract patterns
-    total, by_source, by_lang = count_docs()
+    total, by_source, by_lang = count_docs_from_db()
     patterns = get_issue_patterns()
     
     print(f"Found {total} issues across {len(by_lang)} languages")
     
     # Render all memory bank files
-    files_to_render = [
+    markdown_files = [
         ('productContext.md', render_product_context()),
         ('systemPatterns.md', render_system_patterns(total, by_source, by_lang, patterns)),
         ('decisionLog.md', render_decision_log()),
@@ -825,16 +963,23 @@ def main():
         ('progress.md', render_progress())
     ]
     
-    for filename, content in files_to_render:
-        file_path = MB / filename
-        file_path.write_text(content, encoding='utf-8')
-        print(f"[OK] Rendered {filename}")
+    files_to_write = [(name, text.encode('utf-8')) for name, text in markdown_files]
+    files_to_write += render_schemas()
+    files_to_write.append(('roo-integration-metadata.json', render_integration_metadata()))
     
-    # Create schemas
-    create_schemas()
+    # Writes are independent, so overlap all of them; results are reported in order.
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        written = list(ex.map(
+            lambda item: _write_if_changed(MB / item[0], item[1]),
+            files_to_write
+        ))
     
-    # Create integration metadata
-    create_integration_metadata()
+    for (filename, _), changed in zip(files_to_write, written):
+        if changed:
+            print(f"[OK] Rendered {filename}")
+        else:
+            print(f"[OK] {filename} unchanged")
     
     print(f"\n[SUCCESS] Roo-compatible memory bank rendered successfully!")
     print(f"Location: {MB}")
@@ -1,58 +1,109 @@
 from __future__ import annotations
 
 import logging
+import os
 import sqlite3
+import threading
 import time
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 DB = Path('issuesdb/issues.sqlite')
 logger = logging.getLogger(__name__)
 
 _metrics = {'queries': 0, 'seconds_total': 0.0}
+_local = threading.local()
 
+# Search results are cached per MATCH expression and limit; entries expire so
+# a rebuilt index is picked up without restarting the process.
+CACHE_MAXSIZE = 512
+CACHE_TTL_SECONDS = 3600.0
+_cache: Dict[Tuple[str, int], Tuple[float, Tuple[Dict[str, str], ...]]] = {}
+_cache_lock = threading.Lock()
 
+READ_PRAGMAS = (
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA query_only=1',
+    'PRAGMA temp_store=MEMORY',
+)
+
+
+# Rank inside the FTS index first so only ``limit`` rows reach the join.
+_SQL = (
+    'WITH m AS ('
+    '    SELECT rowid, bm25(fts_issues) AS score'
+    '      FROM fts_issues'
+    '     WHERE fts_issues MATCH ?'
+    '     ORDER BY score'
+    '     LIMIT ?'
+    ')'
+    'SELECT i.issue_id,'
+    '       i.title,'
+    '       i.summary,'
+    '       i.fix_steps,'
+    '       i.language'
+    '  FROM m'
+    '  JOIN issues AS i ON i.rowid = m.rowid'
+    ' ORDER BY m.score'
+)
+
+
+@lru_cache(maxsize=512)
 def _prepare_query(query: str) -> str:
-    return ' '.join(f"{term}*" for term in query.split())
+    return ' '.join([term + '*' for term in query.split()])
+
+
+def _get_conn(db_path: Path | str) -> sqlite3.Connection:
+    """Return this thread's read-only connection to ``db_path``.
+
+    Reusing the handle keeps the FTS shadow tables in SQLite's page cache
+    between searches instead of paying open and schema parsing per query.
+    The file's inode and mtime are checked on each call, so a rebuilt or
+    replaced index gets a fresh connection rather than the old file.
+    """
+    conns = getattr(_local, 'conns', None)
+    if conns is None:
+        conns = _local.conns = {}
+    path = Path(db_path).absolute()
+    key = str(path)
+    try:
+        st = os.stat(key)
+        stamp = (st.st_ino, st.st_mtime_ns)
+    except OSError:
+        stamp = None
+    cached = conns.get(key)
+    if cached is not None:
+        con, seen = cached
+        if stamp is not None and seen == stamp:
+            return con
+        con.close()
+        del conns[key]
+    con = sqlite3.connect(path.as_uri() + '?mode=ro', uri=True)
+    for pragma in READ_PRAGMAS:
+        con.execute(pragma)
+    conns[key] = (con, stamp)
+    return con
 
 
 def query_fts(db_path: Path | str, query: str, limit: int) -> List[Dict[str, str]]:
     assert limit > 0
-    if not query:
-        return []
     fts_query = _prepare_query(query)
+    if not fts_query:
+        return []
     start = time.time()
-    con = sqlite3.connect(db_path)
-    try:
-        cur = con.cursor()
-        cur.execute(
-            (
-                'SELECT i.issue_id,'
-                '       i.title,'
-                '       i.summary,'
-                '       i.fix_steps,'
-                '       i.language'
-                '  FROM fts_issues'
-                '  JOIN issues AS i ON i.rowid = fts_issues.rowid'
-                ' WHERE fts_issues MATCH ?'
-                ' ORDER BY bm25(fts_issues)'
-                ' LIMIT ?'
-            ),
-            (fts_query, limit),
-        )
-        rows = [
-            {
-                'issue_id': r[0],
-                'title': r[1],
-                'summary': r[2],
-                'fix_steps': r[3],
-                'language': r[4],
-            }
-            for r in cur.fetchall()
-        ]
-    finally:
-        con.close()
+    cur = _get_conn(db_path).execute(_SQL, (fts_query, limit))
+    rows = [
+        {
+            'issue_id': r[0],
+            'title': r[1],
+            'summary': r[2],
+            'fix_steps': r[3],
+            'language': r[4],
+        }
+        for r in cur
+    ]
     elapsed = time.time() - start
     _metrics['queries'] += 1
     _metrics['seconds_total'] += elapsed
@@ -60,9 +111,30 @@ def query_fts(db_path: Path | str, query: str, limit: int) -> List[Dict[str, str
     return rows
 
 
-@lru_cache(maxsize=128)
 def search(query: str, limit: int) -> List[Dict[str, str]]:
-    return query_fts(DB, query, limit)
+    # Key on the expression actually passed to MATCH: term order and repeats
+    # change bm25 ranking, so they must not share an entry.
+    key = (_prepare_query(query), limit)
+    now = time.monotonic()
+    with _cache_lock:
+        hit = _cache.get(key)
+    if hit is not None and hit[0] > now:
+        rows = hit[1]
+    else:
+        rows = tuple(query_fts(DB, query, limit))
+        with _cache_lock:
+            _cache.pop(key, None)
+            if len(_cache) >= CACHE_MAXSIZE:
+                del _cache[next(iter(_cache))]
+            _cache[key] = (now + CACHE_TTL_SECONDS, rows)
+    # Callers get their own copies so mutating a result cannot alter the cache.
+    return [dict(row) for row in rows]
+
+
+def clear_cache() -> None:
+    """Drop every cached search result."""
+    with _cache_lock:
+        _cache.clear()
 
 
 def get_metrics() -> Dict[str, float]:
@@ -8,24 +8,45 @@ from __future__ import annotations
 
 import argparse
 import ast
+import hashlib
+import json
 import logging
+import mmap
+import os
 import re
 import sys
 import uuid
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from math import log2
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-SECRET_PATTERNS = [
-    re.compile(r"api_key\s*=", re.IGNORECASE),
-    re.compile(r"secret\s*=", re.IGNORECASE),
-    re.compile(r"token\s*=", re.IGNORECASE),
-]
+SECRET_ASSIGNMENT = rb"(?:api_key|secret|token)\s*="
+# One alternation covers the assignment keywords and quoted high-entropy
+# candidates, so each source buffer is scanned a single time.
+SECRET_SCAN_RE = re.compile(
+    SECRET_ASSIGNMENT + rb"|['\"]([A-Za-z0-9+/=]{20,})['\"]", re.IGNORECASE
+)
+_SECRET_ASSIGNMENT_RE = re.compile(SECRET_ASSIGNMENT, re.IGNORECASE)
+# Validation findings need a ``path`` argument and SQL findings an
+# ``execute`` call; files without either never need an AST.
+AST_PREFILTER_RE = re.compile(rb"path|execute", re.IGNORECASE)
+SQL_STATEMENT_RE = re.compile(r"\b(select|insert|update|delete)\b")
+# Bare-name calls that count as path validation; ``read``/``remove`` do not.
+VALIDATION_NAMES = frozenset({"re", "resolve", "realpath"})
 
 HIGH_ENTROPY_THRESHOLD = 4.0
+PARALLEL_MIN_FILES = 8
+# Kept beside the knowledge base rather than in whatever directory the scan
+# was started from.
+CACHE_FILE = Path(__file__).resolve().parent.parent / ".security_scan_cache.json"
+# Bump when scan rules change so stale cached findings are discarded.
+CACHE_VERSION = 2
 
 
 @dataclass
@@ -34,86 +55,226 @@ class Finding:
     message: str
 
 
+# Finding messages keyed by BLAKE2b digest of the scanned file's content.
+_findings_cache: Dict[str, List[str]] = {}
+_EMPTY_DIGEST = hashlib.blake2b(b"", digest_size=16).hexdigest()
+
+
 def shannon_entropy(data: str) -> float:
-    probabilities = [float(data.count(c)) / len(data) for c in set(data)]
-    return -sum(p * log2(p) for p in probabilities)
+    size = len(data)
+    return -sum(n / size * log2(n / size) for n in Counter(data).values())
 
 
 def is_high_entropy(value: str) -> bool:
     return len(value) >= 20 and shannon_entropy(value) > HIGH_ENTROPY_THRESHOLD
 
 
+def detect_secrets_bytes(source: bytes | mmap.mmap) -> bool:
+    # Every pattern needs an ``=`` or a quote; memchr-speed finds rule out
+    # files without any before the regex engine runs.
+    if source.find(b"=") < 0 and source.find(b"'") < 0 and source.find(b'"') < 0:
+        return False
+    for match in SECRET_SCAN_RE.finditer(source):
+        literal = match.group(1)
+        if literal is None or is_high_entropy(literal.decode("ascii")):
+            return True
+        # A consumed literal can hide an assignment keyword such as ``'token=...'``.
+        if _SECRET_ASSIGNMENT_RE.search(literal):
+            return True
+    return False
+
+
 def detect_secrets(source: str) -> bool:
-    if any(pattern.search(source) for pattern in SECRET_PATTERNS):
-        return True
-    for match in re.finditer(r"['\"]([A-Za-z0-9+/=]{20,})['\"]", source):
-        if is_high_entropy(match.group(1)):
+    return detect_secrets_bytes(source.encode("utf-8"))
+
+
+def _is_validation_call(func: ast.expr) -> bool:
+    if isinstance(func, ast.Attribute):
+        if func.attr == "resolve":
             return True
+        if isinstance(func.value, ast.Name) and func.value.id == "re":
+            return True
+    return isinstance(func, ast.Name) and func.id in VALIDATION_NAMES
+
+
+def _has_path_arg(node: ast.FunctionDef) -> bool:
+    return any("path" in arg.arg.lower() for arg in node.args.args)
+
+
+def _is_unparameterized_sql(call: ast.Call) -> bool:
+    func = call.func
+    if isinstance(func, ast.Attribute) and func.attr in {"execute", "executemany"}:
+        if call.args and isinstance(call.args[0], ast.Constant) and isinstance(call.args[0].value, str):
+            sql = call.args[0].value.lower()
+            return "?" not in sql and SQL_STATEMENT_RE.search(sql) is not None
     return False
 
 
 def function_lacks_validation(node: ast.FunctionDef) -> bool:
-    if not any("path" in arg.arg.lower() for arg in node.args.args):
+    if not _has_path_arg(node):
         return False
     for child in ast.walk(node):
-        if isinstance(child, ast.Call):
-            func = child.func
-            if isinstance(func, ast.Attribute):
-                if func.attr == "resolve":
-                    return False
-                if isinstance(func.value, ast.Name) and func.value.id == "re":
-                    return False
-            if isinstance(func, ast.Name) and func.id.startswith("re"):
-                return False
+        if isinstance(child, ast.Call) and _is_validation_call(child.func):
+            return False
     return True
 
 
 def check_sql_placeholders(node: ast.AST) -> bool:
-    for child in ast.walk(node):
-        if isinstance(child, ast.Call):
-            func = child.func
-            if isinstance(func, ast.Attribute) and func.attr in {"execute", "executemany"}:
-                if child.args and isinstance(child.args[0], ast.Constant) and isinstance(child.args[0].value, str):
-                    sql = child.args[0].value.lower()
-                    if re.search(r"\b(select|insert|update|delete)\b", sql) and "?" not in sql:
-                        return True
-    return False
+    visitor = _ScanVisitor()
+    visitor.visit(node)
+    return visitor.unsafe_sql
+
+
+class _ScanVisitor(ast.NodeVisitor):
+    """Collect validation and SQL findings in a single traversal of a module."""
+
+    def __init__(self) -> None:
+        # One ``[node, validated]`` entry per FunctionDef, in source order.
+        self.functions: List[list] = []
+        self._stack: List[list] = []
+        self.unsafe_sql = False
+
+    # Only FunctionDef and Call need handlers, so dispatch on the exact type
+    # instead of NodeVisitor's per-node ``getattr`` lookup by name.
+    def visit(self, node: ast.AST) -> None:
+        cls = type(node)
+        if cls is ast.FunctionDef:
+            self.visit_FunctionDef(node)
+        elif cls is ast.Call:
+            self.visit_Call(node)
+        else:
+            self.generic_visit(node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        for child in ast.iter_child_nodes(node):
+            self.visit(child)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        frame = [node, False]
+        self.functions.append(frame)
+        self._stack.append(frame)
+        self.generic_visit(node)
+        self._stack.pop()
+        # Calls inside nested functions count for every enclosing function.
+        if frame[1] and self._stack:
+            self._stack[-1][1] = True
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if self._stack and not self._stack[-1][1] and _is_validation_call(node.func):
+            self._stack[-1][1] = True
+        if not self.unsafe_sql and _is_unparameterized_sql(node):
+            self.unsafe_sql = True
+        self.generic_visit(node)
 
 
 def scan_file(path: Path, *, correlation_id: str) -> List[Finding]:
     path = path.resolve()
-    source = path.read_text(encoding="utf-8")
+    with path.open("rb") as handle:
+        # mmap cannot map an empty file, and an empty file has nothing to report.
+        if os.fstat(handle.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as source:
+            return _scan_source(path, source, correlation_id=correlation_id)
+
+
+def scan_file_cached(path: Path, *, correlation_id: str) -> Tuple[str, Optional[List[str]]]:
+    """Return the file's content digest and finding messages.
+
+    Messages are ``None`` when the digest is already cached. The digest is
+    taken over the same mapping that is scanned, so each file is read once.
+    """
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return _EMPTY_DIGEST, []
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as source:
+            digest = hashlib.blake2b(source, digest_size=16).hexdigest()
+            if digest in _findings_cache:
+                return digest, None
+            findings = _scan_source(path, source, correlation_id=correlation_id)
+            return digest, [finding.message for finding in findings]
+
+
+def _seed_cache(findings: Dict[str, List[str]]) -> None:
+    _findings_cache.update(findings)
+
+
+def _scan_source(path: Path, source: mmap.mmap, *, correlation_id: str) -> List[Finding]:
     findings: List[Finding] = []
-    if detect_secrets(source):
+    if detect_secrets_bytes(source):
         findings.append(Finding(path, "potential secret detected"))
+    if AST_PREFILTER_RE.search(source) is None:
+        return findings
     try:
-        tree = ast.parse(source)
+        tree = ast.parse(str(source, "utf-8"))
     except SyntaxError:
         logger.warning("Failed to parse %s", path, extra={"correlation_id": correlation_id})
         return findings
-    for node in [n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)]:
-        if function_lacks_validation(node):
+    visitor = _ScanVisitor()
+    visitor.visit(tree)
+    for node, validated in visitor.functions:
+        if not validated and _has_path_arg(node):
             findings.append(Finding(path, f"function '{node.name}' lacks input validation"))
-    if check_sql_placeholders(tree):
+    if visitor.unsafe_sql:
         findings.append(Finding(path, "SQL statement without parameter placeholders"))
     return findings
 
 
+def load_cache(path: Path) -> None:
+    """Seed the in-process findings cache from ``path`` if it holds a current cache."""
+    try:
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return
+    if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+        _findings_cache.update(data.get("findings", {}))
+
+
+def save_cache(path: Path) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"version": CACHE_VERSION, "findings": _findings_cache}), encoding="utf-8")
+    os.replace(tmp, path)
+
+
 def scan_paths(paths: Iterable[Path], *, correlation_id: str) -> List[Finding]:
-    results: List[Finding] = []
+    files: List[Path] = []
     for path in paths:
         path = path.resolve()
         if path.is_dir():
-            for file in path.rglob("*.py"):
-                results.extend(scan_file(file, correlation_id=correlation_id))
+            files.extend(path.rglob("*.py"))
         elif path.suffix == ".py":
-            results.extend(scan_file(path, correlation_id=correlation_id))
-    return results
+            files.append(path)
+    # Findings depend only on file content, so unchanged files are served
+    # from the cache without being parsed again.
+    files = [file.resolve() for file in files]
+    scan = partial(scan_file_cached, correlation_id=correlation_id)
+    # Files are independent, so spread them across processes; small inputs
+    # are not worth the pool start-up cost. Workers get a copy of the cache
+    # once at start-up so hits are skipped there too.
+    if len(files) < PARALLEL_MIN_FILES:
+        results = list(map(scan, files))
+    else:
+        with ProcessPoolExecutor(initializer=_seed_cache, initargs=(_findings_cache,)) as pool:
+            results = list(pool.map(scan, files, chunksize=16))
+    for digest, messages in results:
+        if messages is not None:
+            _findings_cache[digest] = messages
+    # Drop entries for content not seen in this run, such as deleted or
+    # edited files, so the cache does not grow without bound.
+    current = {digest for digest, _ in results}
+    for stale in _findings_cache.keys() - current:
+        del _findings_cache[stale]
+    return [
+        Finding(file, message)
+        for file, (digest, _) in zip(files, results)
+        for message in _findings_cache[digest]
+    ]
 
 
 def main(argv: List[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Scan Python files for security issues")
     parser.add_argument("path", nargs="?", default=".", help="Path to scan")
+    parser.add_argument("--cache-file", type=Path, default=CACHE_FILE, help="Findings cache reused across runs")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the findings cache")
     args = parser.parse_args(argv)
     correlation_id = str(uuid.uuid4())
     logging.basicConfig(
@@ -124,7 +285,11 @@ def main(argv: List[str] | None = None) -> int:
     if not target.exists():
         logger.error("Path %s does not exist", target, extra={"correlation_id": correlation_id})
         return 1
+    if not args.no_cache:
+        load_cache(args.cache_file)
     findings = scan_paths([target], correlation_id=correlation_id)
+    if not args.no_cache:
+        save_cache(args.cache_file)
     for finding in findings:
         logger.error("%s: %s", finding.path, finding.message, extra={"correlation_id": correlation_id})
     if findings:
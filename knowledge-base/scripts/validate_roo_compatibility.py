@@ -8,7 +8,16 @@ import json
 import pathlib
 import re
 import sys
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from json_utils import load_json
+
+READ_WORKERS = 8
+REQUIRED_FRONTMATTER_FIELDS = ('version', 'updated', 'title')
+_FIELDS_RE = re.compile(r'(version|updated|title):')
+_UPDATED_RE = re.compile(r'updated:\s*(.+)')
+_ISO_TIMESTAMP_RE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z')
 
 def validate_frontmatter(content: str, filename: str) -> List[str]:
     """Validate YAML frontmatter in markdown files"""
@@ -28,26 +37,36 @@ def validate_frontmatter(content: str, filename: str) -> List[str]:
         
         frontmatter = content[4:end_idx]
         
-        # Check required fields
-        required_fields = ['version', 'updated', 'title']
-        for field in required_fields:
-            if f'{field}:' not in frontmatter:
+        # Check required fields with one scan of the frontmatter
+        present = set(_FIELDS_RE.findall(frontmatter))
+        for field in REQUIRED_FRONTMATTER_FIELDS:
+            if field not in present:
                 errors.append(f"{filename}: Missing required frontmatter field: {field}")
         
         # Validate ISO timestamp format
-        if 'updated:' in frontmatter:
-            timestamp_match = re.search(r'updated:\s*(.+)', frontmatter)
-            if timestamp_match:
-                timestamp = timestamp_match.group(1).strip()
-                # Basic ISO format check
-                if not re.match(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z', timestamp):
-                    errors.append(f"{filename}: Invalid timestamp format: {timestamp}")
+        timestamp_match = _UPDATED_RE.search(frontmatter)
+        if timestamp_match:
+            timestamp = timestamp_match.group(1).strip()
+            # Basic ISO format check
+            if not _ISO_TIMESTAMP_RE.match(timestamp):
+                errors.append(f"{filename}: Invalid timestamp format: {timestamp}")
     
     except Exception as e:
         errors.append(f"{filename}: Error parsing frontmatter: {e}")
     
     return errors
 
+def _read_required_file(file_path: pathlib.Path) -> Tuple[str, str, Optional[Exception]]:
+    """Return ``(status, content, error)`` for one required memory-bank file."""
+    if not file_path.exists():
+        return 'missing', '', None
+    if not file_path.is_file():
+        return 'not_file', '', None
+    try:
+        return 'ok', file_path.read_text(encoding='utf-8'), None
+    except Exception as e:
+        return 'ok', '', e
+
 def validate_memory_bank_structure(memory_bank_dir: pathlib.Path) -> Dict[str, List[str]]:
     """Validate the memory-bank directory structure and content"""
     validation_results = {
@@ -77,18 +96,22 @@ def validate_memory_bank_structure(memory_bank_dir: pathlib.Path) -> Dict[str, L
         validation_results["structure"].append("memory-bank is not a directory")
         return validation_results
     
+    # Read every required file concurrently; results are checked in order below.
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as ex:
+        reads = list(ex.map(_read_required_file, (memory_bank_dir / name for name in required_files)))
+
     # Check required files
-    for filename in required_files:
-        file_path = memory_bank_dir / filename
-        if not file_path.exists():
+    for filename, (status, content, read_error) in zip(required_files, reads):
+        if status == 'missing':
             validation_results["structure"].append(f"Missing required file: {filename}")
-        elif not file_path.is_file():
+        elif status == 'not_file':
             validation_results["structure"].append(f"Not a file: {filename}")
         else:
             # Validate file content
             try:
-                content = file_path.read_text(encoding='utf-8')
-                
+                if read_error is not None:
+                    raise read_error
+
                 # Validate frontmatter
                 frontmatter_errors = validate_frontmatter(content, filename)
                 validation_results["content"].extend(frontmatter_errors)
@@ -125,9 +148,8 @@ def validate_memory_bank_structure(memory_bank_dir: pathlib.Path) -> Dict[str, L
                 validation_results["schemas"].append(f"Missing schema: {schema_file}")
             else:
                 try:
-                    with open(schema_path) as f:
-                        schema_data = json.load(f)
-                    
+                    schema_data = load_json(schema_path)
+
                     # Basic JSON schema validation
                     if '$schema' not in schema_data:
                         validation_results["schemas"].append(f"{schema_file}: Missing $schema field")
@@ -152,9 +174,8 @@ def validate_integration_files(base_dir: pathlib.Path) -> List[str]:
         errors.append("Missing roo-integration-metadata.json")
     else:
         try:
-            with open(metadata_file) as f:
-                metadata = json.load(f)
-            
+            metadata = load_json(metadata_file)
+
             required_sections = ['integration_info', 'agent_access_methods', 'refresh_instructions']
             for section in required_sections:
                 if section not in metadata:
@@ -26,17 +26,20 @@
 import asyncio
 import os
 import sys
-import json
 import argparse
-from collections import Counter
+from itertools import chain
 from typing import Any, Dict, List
 
 import aiofiles
+import orjson
 
 from path_utils import InvalidProjectPathError, resolve_project_path
 from validate_config import Colors, print_header
 
 
+OVERSIGHT_AGENTS = frozenset({"quality-assurance-coordinator", "technical-debt-manager"})
+
+
 class AuditError(Exception):
     """Raised when an audit operation fails."""
 
@@ -64,42 +67,44 @@ class ActionsAuditor:
         """Loads data, runs all checks, and prints the final report."""
         print_header(f"Auditing Autonomous Actions for '{self.project_name}'")
         try:
-            async with aiofiles.open(self.workflow_file, "r", encoding="utf-8") as f:
+            async with aiofiles.open(self.workflow_file, "rb") as f:
                 content = await f.read()
-            workflow_data = json.loads(content)
+            workflow_data = orjson.loads(content)
         except FileNotFoundError as e:
             raise AuditError("workflow-state.json not found") from e
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise AuditError("workflow-state.json contains invalid JSON") from e
 
-        all_tasks = (
-            workflow_data.get("pending_tasks", [])
-            + workflow_data.get("active_tasks", [])
-            + workflow_data.get("completed_tasks", [])
-        )
-
-        if not all_tasks:
+        creator_counts: Dict[str, int] = {}
+        title_counts: Dict[str, int] = {}
+        # One walk over every task feeds both checks.
+        for task in chain(
+            workflow_data.get("pending_tasks", []),
+            workflow_data.get("active_tasks", []),
+            workflow_data.get("completed_tasks", []),
+        ):
+            assigned_to = task.get('assigned_to')
+            title = task.get('title', '')
+            # Unassigned remediation tasks have no creator to attribute them to.
+            if assigned_to is not None and (assigned_to in OVERSIGHT_AGENTS or "Remediation:" in title):
+                creator_counts[assigned_to] = creator_counts.get(assigned_to, 0) + 1
+            # Normalize titles to catch simple loops (e.g., ignoring UUIDs)
+            normalized = ' '.join(title.lower().replace('remediation:', '').split()[:4])
+            title_counts[normalized] = title_counts.get(normalized, 0) + 1
+
+        if not title_counts:
             print(
                 f"{Colors.OKGREEN}No tasks found to audit. System is clean.{Colors.ENDC}"
             )
             return
 
-        self._check_high_intervention_rate(all_tasks)
-        self._check_task_loops(all_tasks)
+        self._check_high_intervention_rate(creator_counts)
+        self._check_task_loops(title_counts)
 
         self._print_report()
 
-    def _check_high_intervention_rate(self, all_tasks: List[Dict[str, Any]]) -> None:
-        """Checks for an excessive number of tasks created by oversight agents."""
-        oversight_agents = ["quality-assurance-coordinator", "technical-debt-manager"]
-        intervention_tasks = [
-            task for task in all_tasks
-            if task.get('assigned_to') in oversight_agents or
-               "Remediation:" in task.get('title', '')
-        ]
-
-        creator_counts = Counter(task.get('assigned_to') for task in intervention_tasks)
-
+    def _check_high_intervention_rate(self, creator_counts: Dict[str, int]) -> None:
+        """Flags oversight agents that created an excessive number of tasks."""
         for agent, count in creator_counts.items():
             if count > self.INTERVENTION_THRESHOLD:
                 self.anomalies.append(
@@ -116,18 +121,8 @@ class ActionsAuditor:
                     }
                 )
 
-    def _check_task_loops(self, all_tasks: List[Dict[str, Any]]) -> None:
-        """Checks for tasks with similar titles being created multiple times."""
-        # Normalize titles to catch simple loops (e.g., ignoring UUIDs)
-        normalized_titles = []
-        for task in all_tasks:
-            title = task.get('title', '').lower()
-            # A simple normalization: remove "remediation:", ids, etc.
-            normalized = ' '.join(title.replace('remediation:', '').split()[:4])
-            normalized_titles.append(normalized)
-            
-        title_counts = Counter(normalized_titles)
-        
+    def _check_task_loops(self, title_counts: Dict[str, int]) -> None:
+        """Flags normalized task titles that were created too many times."""
         for title, count in title_counts.items():
             if count > self.LOOP_THRESHOLD:
                 self.anomalies.append({
@@ -23,19 +23,41 @@
 
 import os
 import sys
-import json
 import yaml
 import argparse
 import asyncio
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Tuple
 
-import aiofiles
+import orjson
 
 from path_utils import InvalidProjectPathError, resolve_project_path
 from validate_config import Colors
 
 
+# libyaml's C loader when PyYAML was built with it; same safe subset either way.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Initial tail window for decisionLog.md; entries are short, so this usually suffices.
+DECISION_TAIL_BYTES = 8192
+
+# Parsed inputs keyed by absolute path, valid while (mtime_ns, size, inode) match.
+_PARSE_CACHE: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+
+
+def _cached_parse(path: str, loader: Callable[[str], Any]) -> Any:
+    """Returns ``loader(path)``, reusing the previous result if the file is unchanged."""
+    key = os.path.abspath(path)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    value = loader(path)
+    _PARSE_CACHE[key] = (stamp, value)
+    return value
+
+
 class ReportGenerationError(Exception):
     """Raised when generating the sprint report fails."""
 
@@ -60,46 +82,66 @@ class ReportGenerator:
         print(
             f"{Colors.OKCYAN}--- Loading data for project '{self.project_name}'... ---{Colors.ENDC}"
         )
+        sources = {
+            "sprint": (self._load_yaml, os.path.join(self.control_dir, "sprint.yaml")),
+            "workflow": (self._load_json, os.path.join(self.control_dir, "workflow-state.json")),
+            "quality": (self._load_json, os.path.join(self.control_dir, "quality-dashboard.json")),
+            "decisions": (self._load_decisions, os.path.join(self.memory_dir, "decisionLog.md")),
+        }
+        # The files are independent, so read them concurrently; failures are
+        # reported for the first file in the order above.
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, _cached_parse, path, loader) for loader, path in sources.values()),
+            return_exceptions=True,
+        )
         try:
-            async with aiofiles.open(
-                os.path.join(self.control_dir, "sprint.yaml"),
-                "r",
-                encoding="utf-8",
-            ) as f:
-                sprint_content = await f.read()
-            self.data["sprint"] = yaml.safe_load(sprint_content)
-
-            async with aiofiles.open(
-                os.path.join(self.control_dir, "workflow-state.json"),
-                "r",
-                encoding="utf-8",
-            ) as f:
-                workflow_content = await f.read()
-            self.data["workflow"] = json.loads(workflow_content)
-
-            async with aiofiles.open(
-                os.path.join(self.control_dir, "quality-dashboard.json"),
-                "r",
-                encoding="utf-8",
-            ) as f:
-                quality_content = await f.read()
-            self.data["quality"] = json.loads(quality_content)
-
-            async with aiofiles.open(
-                os.path.join(self.memory_dir, "decisionLog.md"),
-                "r",
-                encoding="utf-8",
-            ) as f:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        except FileNotFoundError as e:
+            raise ReportGenerationError(f"Missing file: {e.filename}") from e
+        except (yaml.YAMLError, orjson.JSONDecodeError) as e:
+            raise ReportGenerationError(f"Failed to parse project data: {e}") from e
+        self.data = dict(zip(sources, results))
+
+    @staticmethod
+    def _load_yaml(path: str) -> Any:
+        with open(path, "r", encoding="utf-8") as f:
+            return yaml.load(f.read(), Loader=_YAML_LOADER)
+
+    @staticmethod
+    def _load_json(path: str) -> Any:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+
+    @staticmethod
+    def _load_decisions(path: str) -> List[str]:
+        """Returns the last five non-heading lines of the decision log.
+
+        Only the tail of the log is read; the window grows until it holds five
+        entries or covers the whole file.
+        """
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            window = DECISION_TAIL_BYTES
+            while True:
+                start = max(0, size - window)
+                f.seek(start)
+                chunk = f.read(size - start)
+                if start:
+                    # The first line of a mid-file window is partial.
+                    cut = chunk.find(b"\n")
+                    chunk = chunk[cut + 1:] if cut >= 0 else b""
+                text = chunk.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
                 lines = [
                     line.strip()
-                    for line in await f.readlines()
+                    for line in text.split("\n")
                     if line.strip() and not line.startswith("#")
                 ]
-            self.data["decisions"] = lines[-5:]
-        except FileNotFoundError as e:
-            raise ReportGenerationError(f"Missing file: {e.filename}") from e
-        except (yaml.YAMLError, json.JSONDecodeError) as e:
-            raise ReportGenerationError(f"Failed to parse project data: {e}") from e
+                if len(lines) >= 5 or not start:
+                    return lines[-5:]
+                window *= 4
 
     def _print_report(self) -> None:
         """Formats and prints the loaded data to the console."""
@@ -107,17 +149,20 @@ class ReportGenerator:
         workflow = self.data['workflow']
         quality = self.data['quality']
         decisions = self.data['decisions']
+        # Collect the report and write it once instead of once per line.
+        lines: List[str] = []
+        out = lines.append
 
         # --- Header ---
-        print(f"\n{Colors.HEADER}{Colors.BOLD}======================================================={Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}  Sprint Report: {sprint_info.get('sprint_id', 'N/A')}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}  Project: {self.project_name}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}  Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}======================================================={Colors.ENDC}")
+        out(f"\n{Colors.HEADER}{Colors.BOLD}======================================================={Colors.ENDC}")
+        out(f"{Colors.HEADER}{Colors.BOLD}  Sprint Report: {sprint_info.get('sprint_id', 'N/A')}{Colors.ENDC}")
+        out(f"{Colors.HEADER}{Colors.BOLD}  Project: {self.project_name}{Colors.ENDC}")
+        out(f"{Colors.HEADER}{Colors.BOLD}  Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{Colors.ENDC}")
+        out(f"{Colors.HEADER}{Colors.BOLD}======================================================={Colors.ENDC}")
 
         # --- Sprint Goal ---
-        print(f"\n{Colors.OKBLUE}{Colors.UNDERLINE}Sprint Goal:{Colors.ENDC}")
-        print(f"  {sprint_info.get('goal', 'No goal defined.')}")
+        out(f"\n{Colors.OKBLUE}{Colors.UNDERLINE}Sprint Goal:{Colors.ENDC}")
+        out(f"  {sprint_info.get('goal', 'No goal defined.')}")
 
         # --- Progress Summary ---
         completed = len(workflow.get('completed_tasks', []))
@@ -126,37 +171,38 @@ class ReportGenerator:
         total = completed + active + pending
         progress_percent = (completed / total * 100) if total > 0 else 0
 
-        print(f"\n{Colors.OKBLUE}{Colors.UNDERLINE}Progress & Velocity:{Colors.ENDC}")
-        print(f"  - {Colors.BOLD}Tasks Completed:{Colors.ENDC} {completed} / {total} ({progress_percent:.1f}%)")
-        print(f"  - {Colors.BOLD}Tasks Active:{Colors.ENDC}    {active}")
-        print(f"  - {Colors.BOLD}Tasks Pending:{Colors.ENDC}   {pending}")
-        print(f"  - {Colors.BOLD}Development Velocity:{Colors.ENDC} {completed} tasks completed this sprint.")
+        out(f"\n{Colors.OKBLUE}{Colors.UNDERLINE}Progress & Velocity:{Colors.ENDC}")
+        out(f"  - {Colors.BOLD}Tasks Completed:{Colors.ENDC} {completed} / {total} ({progress_percent:.1f}%)")
+        out(f"  - {Colors.BOLD}Tasks Active:{Colors.ENDC}    {active}")
+        out(f"  - {Colors.BOLD}Tasks Pending:{Colors.ENDC}   {pending}")
+        out(f"  - {Colors.BOLD}Development Velocity:{Colors.ENDC} {completed} tasks completed this sprint.")
 
         # --- Quality Dashboard ---
         score = quality.get('overall_quality_score', 0)
         trend = quality.get('quality_trend', 'N/A')
         trend_color = Colors.OKGREEN if trend == 'stable' or trend == 'improving' else Colors.FAIL
 
-        print(f"\n{Colors.OKBLUE}{Colors.UNDERLINE}Quality Dashboard:{Colors.ENDC}")
-        print(f"  - {Colors.BOLD}Overall Quality Score:{Colors.ENDC} {score * 100:.1f}%")
-        print(f"  - {Colors.BOLD}Quality Trend:{Colors.ENDC} {trend_color}{trend.capitalize()}{Colors.ENDC}")
-        print(f"  - {Colors.BOLD}Metrics:{Colors.ENDC}")
+        out(f"\n{Colors.OKBLUE}{Colors.UNDERLINE}Quality Dashboard:{Colors.ENDC}")
+        out(f"  - {Colors.BOLD}Overall Quality Score:{Colors.ENDC} {score * 100:.1f}%")
+        out(f"  - {Colors.BOLD}Quality Trend:{Colors.ENDC} {trend_color}{trend.capitalize()}{Colors.ENDC}")
+        out(f"  - {Colors.BOLD}Metrics:{Colors.ENDC}")
         for key, value in quality.get('metrics', {}).items():
             metric_name = key.replace('_', ' ').capitalize()
             # Format as percentage if it's a ratio/coverage
             display_value = f"{value * 100:.1f}%" if 'ratio' in key or 'coverage' in key or 'rate' in key else value
-            print(f"    - {metric_name}: {display_value}")
+            out(f"    - {metric_name}: {display_value}")
 
         # --- Key Autonomous Decisions ---
-        print(f"\n{Colors.OKBLUE}{Colors.UNDERLINE}Recent Autonomous Decisions (from decisionLog.md):{Colors.ENDC}")
+        out(f"\n{Colors.OKBLUE}{Colors.UNDERLINE}Recent Autonomous Decisions (from decisionLog.md):{Colors.ENDC}")
         if decisions:
             for decision in decisions:
                 if decision != "---":
-                    print(f"  - {decision}")
+                    out(f"  - {decision}")
         else:
-            print("  No recent decisions logged.")
+            out("  No recent decisions logged.")
 
-        print(f"\n{Colors.HEADER}{Colors.BOLD}===================== End of Report ====================={Colors.ENDC}\n")
+        out(f"\n{Colors.HEADER}{Colors.BOLD}===================== End of Report ====================={Colors.ENDC}\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 # --- Main Execution ---
@@ -1,3 +1,4 @@
+import json
 import sys
 from pathlib import Path
 
@@ -16,3 +17,41 @@ async def test_run_audit_missing_workflow(tmp_path, monkeypatch) -> None:
     with pytest.raises(AuditError):
         await auditor.run_audit()
 
+
+
+@pytest.mark.asyncio
+async def test_run_audit_invalid_json(tmp_path, monkeypatch) -> None:
+    control = tmp_path / "project" / "demo" / "control"
+    control.mkdir(parents=True)
+    (control / "workflow-state.json").write_bytes(b"{not json")
+    monkeypatch.chdir(tmp_path)
+    auditor = ActionsAuditor("demo")
+    with pytest.raises(AuditError, match="invalid JSON"):
+        await auditor.run_audit()
+
+
+@pytest.mark.asyncio
+async def test_run_audit_flags_interventions_and_loops(tmp_path, monkeypatch) -> None:
+    control = tmp_path / "project" / "demo" / "control"
+    control.mkdir(parents=True)
+    qa = {"assigned_to": "quality-assurance-coordinator", "title": "Remediation: fix flaky login test"}
+    state = {"pending_tasks": [qa, qa], "active_tasks": [qa], "completed_tasks": [qa, {"title": "Ship it"}]}
+    (control / "workflow-state.json").write_text(json.dumps(state), encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    auditor = ActionsAuditor("demo")
+    await auditor.run_audit()
+    assert [a["type"] for a in auditor.anomalies] == ["High Intervention Rate", "Potential Task Loop"]
+    assert "created 4 intervention tasks" in auditor.anomalies[0]["details"]
+    assert "'fix flaky login test...'" in auditor.anomalies[1]["details"]
+
+
+@pytest.mark.asyncio
+async def test_run_audit_ignores_unassigned_remediation(tmp_path, monkeypatch) -> None:
+    control = tmp_path / "project" / "demo" / "control"
+    control.mkdir(parents=True)
+    tasks = [{"title": f"Remediation: issue {i}"} for i in range(5)]
+    (control / "workflow-state.json").write_text(json.dumps({"pending_tasks": tasks}), encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    auditor = ActionsAuditor("demo", loop_threshold=10)
+    await auditor.run_audit()
+    assert auditor.anomalies == []
@@ -0,0 +1,80 @@
+import importlib
+import json
+import random
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "knowledge-base" / "scripts"))
+
+
+def _reference_chunks(text, max_chars):
+    """Paragraph-by-paragraph splitter that chunk_export.chunks must match."""
+    if not text:
+        return []
+    text = text.strip()
+    if len(text) <= max_chars:
+        return [text]
+    parts, buf, total = [], [], 0
+    for para in text.split("\n\n"):
+        if total + len(para) + 2 > max_chars and buf:
+            parts.append("\n\n".join(buf).strip())
+            buf = []
+            total = 0
+        buf.append(para)
+        total += len(para) + 2
+    if buf:
+        parts.append("\n\n".join(buf).strip())
+    fixed = []
+    for p in parts:
+        if len(p) <= max_chars:
+            fixed.append(p)
+        else:
+            fixed.extend(p[i:i + max_chars] for i in range(0, len(p), max_chars))
+    return fixed
+
+
+def _run_export(tmp_path, monkeypatch):
+    """Import chunk_export fresh from ``tmp_path``; the module exports on import."""
+    monkeypatch.chdir(tmp_path)
+    sys.modules.pop("chunk_export", None)
+    return importlib.import_module("chunk_export")
+
+
+def test_chunks_match_reference_splitter(tmp_path, monkeypatch) -> None:
+    chunk_export = _run_export(tmp_path, monkeypatch)
+    rng = random.Random(1234)
+    for _ in range(500):
+        pieces = []
+        for _ in range(rng.randint(0, 12)):
+            pieces.append("x" * rng.randint(0, 90))
+            pieces.append("\n" * rng.randint(1, 5))
+        text = " " * rng.randint(0, 2) + "".join(pieces)
+        for max_chars in (5, 20, 64, 1400):
+            assert chunk_export.chunks(text, max_chars) == _reference_chunks(text, max_chars)
+
+
+def test_export_writes_one_record_per_chunk(tmp_path, monkeypatch) -> None:
+    issue_dir = tmp_path / "issuesdb" / "issues" / "sonar" / "python"
+    issue_dir.mkdir(parents=True)
+    doc = {
+        "issue_id": "a" * 40,
+        "source": "sonar",
+        "language": "python",
+        "title": "Avoid bare except",
+        "summary": "s" * 1500,
+        "signals": [{"kind": "rule_id", "value": "S1"}],
+        "references": [{"label": "doc", "url": "https://example.com"}],
+    }
+    (issue_dir / f"{doc['issue_id']}.json").write_text(json.dumps(doc), encoding="utf-8")
+
+    _run_export(tmp_path, monkeypatch)
+
+    lines = (tmp_path / "exports" / "chunks.jsonl").read_text(encoding="utf-8").splitlines()
+    records = [json.loads(line) for line in lines]
+    assert [r["chunk_ix"] for r in records] == list(range(len(records)))
+    assert len(records) > 1
+    assert records[0]["id"] == f"{doc['issue_id']}:0"
+    assert records[0]["doc_id"] == doc["issue_id"]
+    assert records[0]["text"].startswith("# Avoid bare except")
+    assert records[0]["metadata"]["signals"] == ["S1"]
+    assert records[0]["metadata"]["references"] == ["https://example.com"]
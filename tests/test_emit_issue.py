@@ -0,0 +1,50 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "knowledge-base" / "scripts"))
+
+import emit_issue
+
+
+@pytest.fixture
+def issues_root(tmp_path, monkeypatch):
+    root = tmp_path / "issues"
+    monkeypatch.setattr(emit_issue, "ROOT", root)
+    emit_issue._ensure_outdir.cache_clear()
+    yield root
+    emit_issue._ensure_outdir.cache_clear()
+
+
+def _doc(n, **extra):
+    return {"issue_id": f"{n:040x}", "source": "sonar", "language": "Python", "title": f"issue {n}", **extra}
+
+
+def test_write_issues_batch_writes_canonical_files(issues_root) -> None:
+    paths = emit_issue.write_issues_batch(_doc(n) for n in range(3))
+
+    assert paths == [issues_root / "sonar" / "python" / f"{n:040x}.json" for n in range(3)]
+    written = json.loads(paths[0].read_text(encoding="utf-8"))
+    assert list(written) == sorted(written)
+    assert written["title"] == "issue 0"
+    assert written["updated_at"].endswith("Z")
+    assert not list(issues_root.rglob("*.tmp"))
+
+
+def test_write_issues_batch_rolls_back_on_failure(issues_root) -> None:
+    docs = [_doc(1), _doc(2), {**_doc(3), "issue_id": "not-hex"}]
+    with pytest.raises(ValueError):
+        emit_issue.write_issues_batch(iter(docs))
+
+    assert not [p for p in issues_root.rglob("*") if p.is_file()]
+
+
+def test_write_issue_replaces_existing_file(issues_root) -> None:
+    first = emit_issue.write_issue(_doc(7, summary="old"))
+    second = emit_issue.write_issue(_doc(7, summary="new"))
+
+    assert first == second
+    assert json.loads(second.read_text(encoding="utf-8"))["summary"] == "new"
+    assert not list(issues_root.rglob("*.tmp"))
@@ -0,0 +1,126 @@
+import json
+import os
+import shutil
+import sqlite3
+import sys
+from pathlib import Path
+
+KB_DIR = Path(__file__).resolve().parent.parent / "knowledge-base"
+sys.path.append(str(KB_DIR / "scripts"))
+
+import build_index
+import search
+
+
+def _write_issue(directory: Path, issue_id: str, title: str, signals=(), references=()) -> Path:
+    path = directory / f"{issue_id}.json"
+    doc = {
+        "issue_id": issue_id,
+        "source": "sonar",
+        "language": "python",
+        "title": title,
+        "summary": "shared summary",
+        "signals": [{"kind": "rule", "value": value} for value in signals],
+        "references": [{"label": "doc", "url": url} for url in references],
+    }
+    path.write_text(json.dumps(doc), encoding="utf-8")
+    return path
+
+
+def _touch_later(path: Path) -> None:
+    stamp = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(stamp, stamp))
+
+
+def _ids(query: str):
+    return sorted(row["issue_id"] for row in search.query_fts(Path.cwd() / build_index.DB, query, 50))
+
+
+def _build(tmp_path, monkeypatch, titles) -> None:
+    shutil.copy(KB_DIR / "issues_index.sql", tmp_path / "issues_index.sql")
+    monkeypatch.chdir(tmp_path)
+    issues = tmp_path / "issuesdb" / "issues" / "sonar" / "python"
+    issues.mkdir(parents=True)
+    for n, title in enumerate(titles):
+        _write_issue(issues, f"i{n}", title)
+    build_index.main([])
+
+
+def test_search_cache_keys_on_match_expression(tmp_path, monkeypatch) -> None:
+    _build(tmp_path, monkeypatch, ["alpha beta", "beta alpha alpha"])
+    monkeypatch.setattr(search, "DB", tmp_path / build_index.DB)
+    search.clear_cache()
+    try:
+        first = search.search("alpha beta", 10)
+        first[0]["title"] = "mutated"
+        first.clear()
+        again = search.search("alpha beta", 10)
+        assert sorted(row["title"] for row in again) == ["alpha beta", "beta alpha alpha"]
+        assert len(search._cache) == 1
+        search.search("beta alpha", 10)
+        assert sorted(search._cache) == [("alpha* beta*", 10), ("beta* alpha*", 10)]
+    finally:
+        search.clear_cache()
+
+
+def test_small_batches_index_every_row(tmp_path, monkeypatch) -> None:
+    shutil.copy(KB_DIR / "issues_index.sql", tmp_path / "issues_index.sql")
+    monkeypatch.chdir(tmp_path)
+    issues = tmp_path / "issuesdb" / "issues" / "sonar" / "python"
+    issues.mkdir(parents=True)
+    for n in range(5):
+        _write_issue(
+            issues,
+            f"i{n}",
+            f"batched issue {n}",
+            signals=[f"R{n}a", f"R{n}b"],
+            references=[f"https://example.com/{n}"],
+        )
+    build_index.main(["--batch-size", "2"])
+
+    con = sqlite3.connect(build_index.DB)
+    try:
+        counts = [
+            con.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("issues", "signals", "references_web")
+        ]
+    finally:
+        con.close()
+    assert counts == [5, 10, 5]
+    assert _ids("batched") == ["i0", "i1", "i2", "i3", "i4"]
+    assert _ids("R3b") == ["i3"]
+
+
+def test_rebuild_after_delete_and_update_keeps_search_working(tmp_path, monkeypatch) -> None:
+    shutil.copy(KB_DIR / "issues_index.sql", tmp_path / "issues_index.sql")
+    monkeypatch.chdir(tmp_path)
+    issues = tmp_path / "issuesdb" / "issues" / "sonar" / "python"
+    issues.mkdir(parents=True)
+    for n in range(4):
+        _write_issue(issues, f"i{n}", f"issue number {n}", signals=[f"S{n}"])
+    build_index.main([])
+    assert _ids("issue") == ["i0", "i1", "i2", "i3"]
+
+    (issues / "i1.json").unlink()
+    _touch_later(_write_issue(issues, "i2", "renamed entry", signals=["S9"]))
+    build_index.main([])
+
+    assert _ids("issue") == ["i0", "i3"]
+    assert _ids("renamed") == ["i2"]
+    assert _ids("S2") == []
+    assert _ids("S9") == ["i2"]
+
+
+def test_search_reconnects_after_index_is_replaced(tmp_path, monkeypatch) -> None:
+    _build(tmp_path, monkeypatch, ["original entry"])
+    assert _ids("original") == ["i0"]
+
+    for path in (tmp_path / "issuesdb").glob("issues.sqlite*"):
+        path.unlink()
+    (tmp_path / "issuesdb" / "index_state.json").unlink()
+    issues = tmp_path / "issuesdb" / "issues" / "sonar" / "python"
+    _write_issue(issues, "i0", "replacement entry")
+    build_index.main([])
+
+    assert _ids("original") == []
+    assert _ids("replacement") == ["i0"]
@@ -0,0 +1,64 @@
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+KB_DIR = Path(__file__).resolve().parent.parent / "knowledge-base"
+sys.path.append(str(KB_DIR / "scripts"))
+
+import build_index
+import render_memory_bank
+
+
+@pytest.fixture
+def built_index(tmp_path, monkeypatch):
+    shutil.copy(KB_DIR / "issues_index.sql", tmp_path / "issues_index.sql")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(render_memory_bank, "_CONN", None)
+    docs = [
+        ("sonar", "Python", "major", "bug"),
+        ("sonar", "python", "major", "code_smell"),
+        ("sonar", None, "minor", "bug"),
+        ("manual", "java", "critical", "vulnerability"),
+    ]
+    for n, (source, language, severity, issue_type) in enumerate(docs):
+        folder = tmp_path / "issuesdb" / "issues" / source / (language or "unknown").lower()
+        folder.mkdir(parents=True, exist_ok=True)
+        doc = {
+            "issue_id": f"{n:040x}",
+            "source": source,
+            "language": language,
+            "title": f"issue {n}",
+            "severity": severity,
+            "metadata": {"type": issue_type},
+        }
+        (folder / f"{doc['issue_id']}.json").write_text(json.dumps(doc), encoding="utf-8")
+    build_index.main([])
+    yield tmp_path
+    if render_memory_bank._CONN is not None:
+        render_memory_bank._CONN.close()
+
+
+def test_count_docs_from_db_matches_file_scan(built_index) -> None:
+    expected = render_memory_bank.count_docs()
+    assert expected == (4, [("manual", 1), ("sonar", 3)], [("java", 1), ("python", 2), ("unknown", 1)])
+    assert render_memory_bank.count_docs_from_db() == expected
+
+
+def test_issue_patterns_group_severity_and_type(built_index) -> None:
+    stats = render_memory_bank._get_issue_patterns_uncached()
+    # Largest first; ties keep no particular order.
+    assert stats.severity_distribution[0] == ("major", 2)
+    assert dict(stats.severity_distribution) == {"major": 2, "minor": 1, "critical": 1}
+    assert stats.common_issue_types[0] == ("bug", 2)
+    assert dict(stats.common_issue_types) == {"bug": 2, "code_smell": 1, "vulnerability": 1}
+
+
+def test_write_if_changed_ignores_render_timestamps(tmp_path) -> None:
+    target = tmp_path / "page.md"
+    assert render_memory_bank._write_if_changed(target, b"---\nupdated: 2024-01-01T00:00:00Z\n---\nbody\n")
+    assert not render_memory_bank._write_if_changed(target, b"---\nupdated: 2025-06-30T12:34:56Z\n---\nbody\n")
+    assert target.read_bytes().startswith(b"---\nupdated: 2024-01-01")
+    assert render_memory_bank._write_if_changed(target, b"---\nupdated: 2025-06-30T12:34:56Z\n---\nchanged\n")
@@ -5,7 +5,7 @@ import pytest
 
 sys.path.append(str(Path(__file__).resolve().parent.parent / "scripts"))
 
-from generate_sprint_report import ReportGenerator, ReportGenerationError
+from generate_sprint_report import ReportGenerator, ReportGenerationError, _cached_parse
 import aiofiles
 
 
@@ -23,3 +23,38 @@ async def test_generate_report_missing_file(tmp_path, monkeypatch) -> None:
     with pytest.raises(ReportGenerationError):
         await reporter.generate_report()
 
+
+@pytest.mark.asyncio
+async def test_load_data_parses_project_files(tmp_path, monkeypatch) -> None:
+    control = tmp_path / "project" / "demo" / "control"
+    control.mkdir(parents=True)
+    (tmp_path / "memory-bank").mkdir()
+    (control / "sprint.yaml").write_text("sprint_id: S-1\ngoal: test\n", encoding="utf-8")
+    (control / "workflow-state.json").write_text('{"pending_tasks": [{"title": "a"}]}', encoding="utf-8")
+    (control / "quality-dashboard.json").write_text('{"overall_quality_score": 0.5}', encoding="utf-8")
+    entries = "".join(f"- decision {i}\n" for i in range(8))
+    (tmp_path / "memory-bank" / "decisionLog.md").write_text(f"# log\n\n{entries}", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    reporter = ReportGenerator("demo")
+    await reporter._load_data()
+    assert reporter.data["sprint"] == {"sprint_id": "S-1", "goal": "test"}
+    assert reporter.data["workflow"] == {"pending_tasks": [{"title": "a"}]}
+    assert reporter.data["quality"] == {"overall_quality_score": 0.5}
+    assert reporter.data["decisions"] == [f"- decision {i}" for i in range(3, 8)]
+
+
+def test_cached_parse_reloads_only_changed_files(tmp_path) -> None:
+    target = tmp_path / "state.json"
+    target.write_text("{}", encoding="utf-8")
+    calls = []
+
+    def loader(path: str) -> str:
+        calls.append(path)
+        return Path(path).read_text(encoding="utf-8")
+
+    assert _cached_parse(str(target), loader) == "{}"
+    assert _cached_parse(str(target), loader) == "{}"
+    assert len(calls) == 1
+    target.write_text('{"a": 1}', encoding="utf-8")
+    assert _cached_parse(str(target), loader) == '{"a": 1}'
+    assert len(calls) == 2
@@ -0,0 +1,96 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "knowledge-base" / "scripts"))
+
+import security_scan
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    security_scan._findings_cache.clear()
+    yield
+    security_scan._findings_cache.clear()
+
+
+def _messages(findings):
+    return sorted((finding.path.name, finding.message) for finding in findings)
+
+
+def test_findings_on_fixture_tree(tmp_path) -> None:
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "secrets.py").write_text('API_KEY = "abc"\n', encoding="utf-8")
+    (pkg / "entropy.py").write_text('VALUE = "Zq8Lm2Xv9Rt4Wp7Ks1Nb6Hd3"\n', encoding="utf-8")
+    (pkg / "io.py").write_text(
+        "import re\n"
+        "from pathlib import Path\n\n"
+        "def load(path):\n"
+        "    return open(path).read()\n\n"
+        "def load_checked(path):\n"
+        "    return Path(path).resolve().read_text()\n\n"
+        "def load_matched(path):\n"
+        "    re.match(r'[a-z]+', path)\n"
+        "    return open(path).read()\n",
+        encoding="utf-8",
+    )
+    (pkg / "db.py").write_text(
+        "def run(cur, name):\n"
+        "    cur.execute('SELECT * FROM t WHERE name = ?', (name,))\n"
+        "    cur.execute('DELETE FROM t')\n",
+        encoding="utf-8",
+    )
+    (pkg / "safe.py").write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    (pkg / "broken.py").write_text("def f(path:\n    token = 1\n", encoding="utf-8")
+    (pkg / "empty.py").write_text("", encoding="utf-8")
+    (pkg / "notes.txt").write_text("secret = 1\n", encoding="utf-8")
+
+    findings = security_scan.scan_paths([pkg], correlation_id="test")
+
+    assert _messages(findings) == [
+        ("broken.py", "potential secret detected"),
+        ("db.py", "SQL statement without parameter placeholders"),
+        ("entropy.py", "potential secret detected"),
+        ("io.py", "function 'load' lacks input validation"),
+        ("secrets.py", "potential secret detected"),
+    ]
+
+
+def test_parallel_scan_matches_serial(tmp_path, monkeypatch) -> None:
+    count = security_scan.PARALLEL_MIN_FILES + 2
+    for n in range(count):
+        (tmp_path / f"m{n}.py").write_text(f"def f{n}(path):\n    return path\n", encoding="utf-8")
+    parallel = security_scan.scan_paths([tmp_path], correlation_id="test")
+    security_scan._findings_cache.clear()
+    monkeypatch.setattr(security_scan, "PARALLEL_MIN_FILES", 10_000)
+    serial = security_scan.scan_paths([tmp_path], correlation_id="test")
+    assert _messages(parallel) == _messages(serial)
+    assert len(serial) == count
+
+
+def test_cache_drops_entries_not_seen_in_run(tmp_path) -> None:
+    (tmp_path / "a.py").write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("y = 2\n", encoding="utf-8")
+    security_scan.scan_paths([tmp_path], correlation_id="test")
+    assert len(security_scan._findings_cache) == 2
+
+    (tmp_path / "b.py").unlink()
+    security_scan.scan_paths([tmp_path], correlation_id="test")
+    assert len(security_scan._findings_cache) == 1
+
+
+def test_cached_findings_skip_rescan(tmp_path, monkeypatch) -> None:
+    (tmp_path / "mod.py").write_text("def load(path):\n    return open(path).read()\n", encoding="utf-8")
+    cache_file = tmp_path / "cache.json"
+    first = security_scan.scan_paths([tmp_path], correlation_id="test")
+    security_scan.save_cache(cache_file)
+    security_scan._findings_cache.clear()
+    security_scan.load_cache(cache_file)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached file was scanned again")
+
+    monkeypatch.setattr(security_scan, "_scan_source", fail)
+    assert _messages(security_scan.scan_paths([tmp_path], correlation_id="test")) == _messages(first)